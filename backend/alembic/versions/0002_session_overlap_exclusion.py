@@ -0,0 +1,31 @@
+"""session overlap exclusion constraint
+
+Revision ID: 0002_session_overlap_exclusion
+Revises: 0001_initial
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0002_session_overlap_exclusion"
+down_revision = "0001_initial"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gist")
+    op.execute(
+        "ALTER TABLE sessions ADD CONSTRAINT sessions_no_overlap "
+        "EXCLUDE USING gist (resource_id WITH =, tsrange(start_at, end_at) WITH &&) "
+        "WHERE (status <> 'canceled')"
+    )
+    op.create_index("ix_sessions_location_id_start_at", "sessions", ["location_id", "start_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sessions_location_id_start_at", table_name="sessions")
+    op.execute("ALTER TABLE sessions DROP CONSTRAINT sessions_no_overlap")
@@ -0,0 +1,30 @@
+"""games and resources updated_at
+
+Revision ID: 0003_games_resources_updated_at
+Revises: 0002_session_overlap_exclusion
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0003_games_resources_updated_at"
+down_revision = "0002_session_overlap_exclusion"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    for table in ("games", "resources"):
+        op.add_column(
+            table,
+            sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        )
+
+
+def downgrade() -> None:
+    for table in ("games", "resources"):
+        op.drop_column(table, "updated_at")
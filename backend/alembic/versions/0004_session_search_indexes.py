@@ -0,0 +1,47 @@
+"""session search indexes
+
+Revision ID: 0004_session_search_indexes
+Revises: 0003_games_resources_updated_at
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0004_session_search_indexes"
+down_revision = "0003_games_resources_updated_at"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # Keyset order of GET /sessions, plus the common equality filters in front of it.
+    op.create_index("ix_sessions_start_at_id", "sessions", ["start_at", "id"])
+    op.create_index("ix_sessions_resource_id_start_at", "sessions", ["resource_id", "start_at"])
+    op.create_index("ix_sessions_game_id_start_at", "sessions", ["game_id", "start_at"])
+    # Substring (ILIKE '%...%') lookups of returning customers and comments.
+    op.create_index(
+        "ix_sessions_contact_phone_trgm",
+        "sessions",
+        ["contact_phone"],
+        postgresql_using="gin",
+        postgresql_ops={"contact_phone": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_sessions_comment_trgm",
+        "sessions",
+        ["comment"],
+        postgresql_using="gin",
+        postgresql_ops={"comment": "gin_trgm_ops"},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sessions_comment_trgm", table_name="sessions")
+    op.drop_index("ix_sessions_contact_phone_trgm", table_name="sessions")
+    op.drop_index("ix_sessions_game_id_start_at", table_name="sessions")
+    op.drop_index("ix_sessions_resource_id_start_at", table_name="sessions")
+    op.drop_index("ix_sessions_start_at_id", table_name="sessions")
@@ -0,0 +1,39 @@
+"""session daily stats rollup
+
+Revision ID: 0005_session_daily_stats
+Revises: 0004_session_search_indexes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0005_session_daily_stats"
+down_revision = "0004_session_search_indexes"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "session_daily_stats",
+        sa.Column("location_id", sa.Integer(), sa.ForeignKey("locations.id"), primary_key=True),
+        sa.Column("resource_id", sa.Integer(), sa.ForeignKey("resources.id"), primary_key=True),
+        sa.Column("game_id", sa.Integer(), sa.ForeignKey("games.id"), primary_key=True),
+        sa.Column("day", sa.Date(), primary_key=True),
+        sa.Column("sessions", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("canceled", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("completed", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("booked_minutes", sa.Integer(), nullable=False, server_default=sa.text("0")),
+        sa.Column("players", sa.Integer(), nullable=False, server_default=sa.text("0")),
+    )
+    # Reports filter by date range first.
+    op.create_index("ix_session_daily_stats_day", "session_daily_stats", ["day"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_session_daily_stats_day", table_name="session_daily_stats")
+    op.drop_table("session_daily_stats")
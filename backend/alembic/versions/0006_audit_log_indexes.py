@@ -0,0 +1,28 @@
+"""audit log lookup indexes
+
+Revision ID: 0006_audit_log_indexes
+Revises: 0005_session_daily_stats
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0006_audit_log_indexes"
+down_revision = "0005_session_daily_stats"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index("ix_audit_logs_entity_created_at", "audit_logs", ["entity_type", "entity_id", "created_at"])
+    op.create_index("ix_audit_logs_user_id_created_at", "audit_logs", ["user_id", "created_at"])
+    op.create_index("ix_audit_logs_created_at", "audit_logs", ["created_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_logs_created_at", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_user_id_created_at", table_name="audit_logs")
+    op.drop_index("ix_audit_logs_entity_created_at", table_name="audit_logs")
@@ -0,0 +1,118 @@
+"""partition audit_logs by month
+
+Revision ID: 0007_audit_log_partitioning
+Revises: 0006_audit_log_indexes
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from datetime import date, datetime, timezone
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0007_audit_log_partitioning"
+down_revision = "0006_audit_log_indexes"
+branch_labels = None
+depends_on = None
+
+MONTHS_AHEAD = 3
+COLUMNS = "id, user_id, entity_type, entity_id, action, changes, created_at"
+INDEXES = (
+    ("ix_audit_logs_entity_created_at", ["entity_type", "entity_id", "created_at"]),
+    ("ix_audit_logs_user_id_created_at", ["user_id", "created_at"]),
+    ("ix_audit_logs_created_at", ["created_at"]),
+)
+
+
+def _next_month(month: date) -> date:
+    return date(month.year + month.month // 12, month.month % 12 + 1, 1)
+
+
+def _drop_indexes() -> None:
+    for name, _ in INDEXES:
+        op.drop_index(name, table_name="audit_logs")
+
+
+def _create_indexes() -> None:
+    for name, columns in INDEXES:
+        op.create_index(name, "audit_logs", columns)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    _drop_indexes()
+    op.execute("ALTER TABLE audit_logs RENAME TO audit_logs_legacy")
+    op.execute("ALTER TABLE audit_logs_legacy RENAME CONSTRAINT audit_logs_pkey TO audit_logs_legacy_pkey")
+
+    # The partition key has to be part of the primary key.
+    op.execute(
+        """
+        CREATE TABLE audit_logs (
+            id integer NOT NULL DEFAULT nextval('audit_logs_id_seq'::regclass),
+            user_id integer NOT NULL REFERENCES users (id),
+            entity_type varchar(50) NOT NULL,
+            entity_id integer NOT NULL,
+            action varchar(50) NOT NULL,
+            changes json NOT NULL,
+            created_at timestamptz NOT NULL DEFAULT now(),
+            PRIMARY KEY (id, created_at)
+        ) PARTITION BY RANGE (created_at)
+        """
+    )
+    # The serial sequence belongs to the legacy column and would be dropped
+    # together with that table unless its ownership moves first.
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs.id")
+
+    first = bind.execute(
+        sa.text("SELECT min(created_at) AT TIME ZONE 'UTC' FROM audit_logs_legacy")
+    ).scalar()
+    today = datetime.now(timezone.utc).date()
+    month = (first.date() if first else today).replace(day=1)
+    last = today.replace(day=1)
+    for _ in range(MONTHS_AHEAD):
+        last = _next_month(last)
+    while month <= last:
+        upper = _next_month(month)
+        op.execute(
+            f"CREATE TABLE audit_logs_p{month:%Y%m} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{upper.isoformat()} 00:00:00+00')"
+        )
+        month = upper
+    op.execute("CREATE TABLE audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+    op.execute(
+        f"INSERT INTO audit_logs ({COLUMNS}) "
+        f"SELECT id, user_id, entity_type, entity_id, action, changes, coalesce(created_at, now()) "
+        f"FROM audit_logs_legacy"
+    )
+    op.execute("DROP TABLE audit_logs_legacy")
+    _create_indexes()
+
+
+def downgrade() -> None:
+    _drop_indexes()
+    op.execute(
+        """
+        CREATE TABLE audit_logs_plain (
+            id integer NOT NULL DEFAULT nextval('audit_logs_id_seq'::regclass),
+            user_id integer NOT NULL REFERENCES users (id),
+            entity_type varchar(50) NOT NULL,
+            entity_id integer NOT NULL,
+            action varchar(50) NOT NULL,
+            changes json NOT NULL,
+            created_at timestamptz DEFAULT now(),
+            CONSTRAINT audit_logs_plain_pkey PRIMARY KEY (id)
+        )
+        """
+    )
+    op.execute("ALTER SEQUENCE audit_logs_id_seq OWNED BY audit_logs_plain.id")
+    op.execute(f"INSERT INTO audit_logs_plain ({COLUMNS}) SELECT {COLUMNS} FROM audit_logs")
+    # Drops the attached partitions with it; detached ones are left alone.
+    op.execute("DROP TABLE audit_logs")
+    op.execute("ALTER TABLE audit_logs_plain RENAME TO audit_logs")
+    op.execute("ALTER TABLE audit_logs RENAME CONSTRAINT audit_logs_plain_pkey TO audit_logs_pkey")
+    op.execute("ALTER TABLE audit_logs RENAME CONSTRAINT audit_logs_plain_user_id_fkey TO audit_logs_user_id_fkey")
+    _create_indexes()
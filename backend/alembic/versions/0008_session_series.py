@@ -0,0 +1,68 @@
+"""recurring session series
+
+Revision ID: 0008_session_series
+Revises: 0007_audit_log_partitioning
+Create Date: 2026-10-18 00:00:00.000000
+
+"""
+from __future__ import annotations
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "0008_session_series"
+down_revision = "0007_audit_log_partitioning"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # create_table emits CREATE TYPE for the enum on PostgreSQL.
+    op.create_table(
+        "session_series",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("location_id", sa.Integer(), sa.ForeignKey("locations.id"), nullable=False),
+        sa.Column("resource_id", sa.Integer(), sa.ForeignKey("resources.id"), nullable=False),
+        sa.Column("game_id", sa.Integer(), sa.ForeignKey("games.id"), nullable=False),
+        sa.Column("frequency", sa.Enum("daily", "weekly", name="series_frequency"), nullable=False),
+        sa.Column("interval", sa.Integer(), nullable=False, server_default=sa.text("1")),
+        sa.Column("weekdays", sa.JSON(), nullable=False),
+        sa.Column("start_date", sa.Date(), nullable=False),
+        sa.Column("until_date", sa.Date(), nullable=True),
+        sa.Column("count", sa.Integer(), nullable=True),
+        sa.Column("start_time", sa.Time(), nullable=False),
+        sa.Column("duration_min", sa.Integer(), nullable=False),
+        sa.Column("exceptions", sa.JSON(), nullable=False),
+        sa.Column("players", sa.Integer(), nullable=True),
+        sa.Column("contact_name", sa.String(length=255), nullable=True),
+        sa.Column("contact_phone", sa.String(length=64), nullable=True),
+        sa.Column("comment", sa.Text(), nullable=True),
+        sa.Column("created_by_id", sa.Integer(), sa.ForeignKey("users.id"), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=True),
+    )
+    op.add_column(
+        "sessions",
+        sa.Column(
+            "series_id",
+            sa.Integer(),
+            sa.ForeignKey("session_series.id", name="fk_sessions_series_id", ondelete="SET NULL"),
+            nullable=True,
+        ),
+    )
+    # Partial: almost all sessions are one-off bookings.
+    op.create_index(
+        "ix_sessions_series_id",
+        "sessions",
+        ["series_id"],
+        postgresql_where=sa.text("series_id IS NOT NULL"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_sessions_series_id", table_name="sessions")
+    op.drop_constraint("fk_sessions_series_id", "sessions", type_="foreignkey")
+    op.drop_column("sessions", "series_id")
+    op.drop_table("session_series")
+    sa.Enum("daily", "weekly", name="series_frequency").drop(op.get_bind())
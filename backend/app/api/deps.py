@@ -1,39 +1,105 @@
 from __future__ import annotations
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError, jwt
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
+from app.api.read_your_writes import min_lsn, primary_pinned
 from app.core.config import settings
-from app.db.session import get_db
+from app.core.principals import Principal, principal_cache
+from app.db import session as db_session
+from app.db.replicas import read_replicas
+from app.db.session import get_async_db, get_db
 from app.models.user import User
 from app.models.enums import UserRole
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
+oauth2_scheme_optional = OAuth2PasswordBearer(tokenUrl="/auth/login", auto_error=False)
 
 
-def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> User:
-    credentials_exception = HTTPException(
+def _read_replica(request: Request):
+    return None if primary_pinned(request) else read_replicas.pick(min_lsn(request))
+
+
+def get_read_db(request: Request):
+    replica = _read_replica(request)
+    db = (replica.SessionLocal if replica is not None else db_session.SessionLocal)()
+    try:
+        yield db
+    finally:
+        db.close()
+
+
+async def get_async_read_db(request: Request):
+    replica = _read_replica(request)
+    factory = replica.AsyncSessionLocal if replica is not None else db_session.AsyncSessionLocal
+    if factory is None:
+        raise RuntimeError("ASYNC_DB_ENABLED is off")
+    async with factory() as db:
+        yield db
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _decode_user_id(token: str) -> int:
     try:
         payload = jwt.decode(token, settings.JWT_SECRET, algorithms=[settings.JWT_ALGORITHM])
         subject = payload.get("sub")
         if subject is None:
-            raise credentials_exception
+            raise _credentials_exception()
     except JWTError as exc:
-        raise credentials_exception from exc
+        raise _credentials_exception() from exc
+    return int(subject)
+
 
-    user = db.query(User).filter(User.id == int(subject)).first()
+def _remember(user: User | None) -> Principal:
     if user is None or not user.is_active:
-        raise credentials_exception
-    return user
+        raise _credentials_exception()
+    principal = Principal.from_user(user)
+    principal_cache.set(user.id, principal)
+    return principal
+
+
+def get_current_user(db: Session = Depends(get_db), token: str = Depends(oauth2_scheme)) -> Principal:
+    user_id = _decode_user_id(token)
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        principal = _remember(db.query(User).filter(User.id == user_id).first())
+    return principal
+
+
+def get_stream_user(
+    access_token: str | None = None,
+    token: str | None = Depends(oauth2_scheme_optional),
+    db: Session = Depends(get_db),
+) -> Principal:
+    # EventSource cannot set an Authorization header, so streams also accept ?access_token=.
+    return get_current_user(db, token or access_token or "")
 
 
-def require_owner(user: User = Depends(get_current_user)) -> User:
+async def get_current_user_async(
+    db: AsyncSession = Depends(get_async_db), token: str = Depends(oauth2_scheme)
+) -> Principal:
+    user_id = _decode_user_id(token)
+    principal = principal_cache.get(user_id)
+    if principal is None:
+        principal = _remember(await db.get(User, user_id))
+    return principal
+
+
+def require_owner(user: Principal = Depends(get_current_user)) -> Principal:
     if user.role != UserRole.owner:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Owner access required")
     return user
+
+
+async def require_owner_async(user: Principal = Depends(get_current_user_async)) -> Principal:
+    return require_owner(user)
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import time
+
+from fastapi import Request
+
+from app.core.config import settings
+from app.db.replicas import parse_lsn
+
+COOKIE_NAME = "read_primary_until"
+HEADER_NAME = "X-Read-Primary-Until"
+MIN_LSN_HEADER = "X-Min-LSN"
+MUTATING_METHODS = {"POST", "PUT", "PATCH", "DELETE"}
+
+
+def primary_pinned(request: Request) -> bool:
+    # Browsers carry the cookie; API clients can echo the response header.
+    value = request.headers.get(HEADER_NAME) or request.cookies.get(COOKIE_NAME)
+    try:
+        return value is not None and float(value) > time.time()
+    except ValueError:
+        return False
+
+
+def min_lsn(request: Request) -> int | None:
+    # Calendar events carry the primary's WAL position after the write ("lsn").
+    # A client refetching because of an event echoes it here, so the read only
+    # goes to a replica that has replayed that write.
+    value = request.headers.get(MIN_LSN_HEADER)
+    try:
+        return None if not value else parse_lsn(value)
+    except ValueError:
+        return None
+
+
+# After a successful write the client reads from the primary for a few
+# seconds, long enough for replicas to catch up with what it just changed.
+class ReadYourWritesMiddleware:
+    def __init__(self, app) -> None:
+        self.app = app
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or scope["method"] not in MUTATING_METHODS:
+            await self.app(scope, receive, send)
+            return
+
+        async def send_with_pin(message) -> None:
+            if message["type"] == "http.response.start" and message["status"] < 400:
+                until = str(int(time.time()) + settings.READ_YOUR_WRITES_SECONDS)
+                cookie = (
+                    f"{COOKIE_NAME}={until}; Max-Age={settings.READ_YOUR_WRITES_SECONDS}; "
+                    "Path=/; HttpOnly; SameSite=Lax"
+                )
+                message["headers"] = [
+                    *message.get("headers", []),
+                    (b"set-cookie", cookie.encode()),
+                    (HEADER_NAME.lower().encode(), until.encode()),
+                ]
+            await send(message)
+
+        await self.app(scope, receive, send_with_pin)
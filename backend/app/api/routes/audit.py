@@ -0,0 +1,55 @@
+from datetime import date as date_type, datetime, time, timedelta, timezone
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select, tuple_
+from sqlalchemy.orm import Session
+
+from app.api.deps import require_owner
+from app.api.pagination import decode_cursor, encode_cursor
+from app.db.session import get_db
+from app.models.audit_log import AuditLog
+from app.schemas.audit_log import AuditLogOut, AuditLogPage
+
+router = APIRouter(prefix="/audit", tags=["audit"])
+
+AUDIT_PAGE_MAX = 500
+
+
+def _utc_midnight(day: date_type) -> datetime:
+    return datetime.combine(day, time.min, tzinfo=timezone.utc)
+
+
+@router.get("", response_model=AuditLogPage)
+def list_audit(
+    entity_type: str | None = None,
+    entity_id: int | None = None,
+    user_id: int | None = None,
+    action: str | None = None,
+    from_date: date_type | None = Query(default=None, alias="from"),
+    to_date: date_type | None = Query(default=None, alias="to"),
+    cursor: str | None = None,
+    limit: int = Query(default=100, ge=1, le=AUDIT_PAGE_MAX),
+    db: Session = Depends(get_db),
+    user=Depends(require_owner),
+) -> AuditLogPage:
+    query = select(AuditLog)
+    if entity_type is not None:
+        query = query.where(AuditLog.entity_type == entity_type)
+    if entity_id is not None:
+        query = query.where(AuditLog.entity_id == entity_id)
+    if user_id is not None:
+        query = query.where(AuditLog.user_id == user_id)
+    if action is not None:
+        query = query.where(AuditLog.action == action)
+    # Bounds on created_at also let PostgreSQL skip whole monthly partitions.
+    if from_date is not None:
+        query = query.where(AuditLog.created_at >= _utc_midnight(from_date))
+    if to_date is not None:
+        query = query.where(AuditLog.created_at < _utc_midnight(to_date + timedelta(days=1)))
+    if cursor:
+        query = query.where(tuple_(AuditLog.created_at, AuditLog.id) < tuple_(*decode_cursor(cursor)))
+
+    # Newest first, one extra row to know whether another page exists.
+    rows = db.scalars(query.order_by(AuditLog.created_at.desc(), AuditLog.id.desc()).limit(limit + 1)).all()
+    next_cursor = encode_cursor(rows[limit - 1].created_at, rows[limit - 1].id) if len(rows) > limit else None
+    return AuditLogPage(items=[AuditLogOut.model_validate(row) for row in rows[:limit]], next_cursor=next_cursor)
@@ -1,7 +1,8 @@
 from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi.concurrency import run_in_threadpool
 from sqlalchemy.orm import Session
 
-from app.core.security import create_access_token, verify_password
+from app.core.security import PasswordQueueFull, create_access_token, verify_and_update_password
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.auth import LoginRequest, LoginResponse, UserInfo
@@ -9,11 +10,34 @@ from app.schemas.auth import LoginRequest, LoginResponse, UserInfo
 router = APIRouter(prefix="/auth", tags=["auth"])
 
 
+def _find_user(db: Session, email: str) -> User | None:
+    return db.query(User).filter(User.email == email).first()
+
+
+def _store_hash(db: Session, user: User, password_hash: str) -> None:
+    user.password_hash = password_hash
+    db.commit()
+    db.refresh(user)
+
+
 @router.post("/login", response_model=LoginResponse)
-def login(payload: LoginRequest, db: Session = Depends(get_db)) -> LoginResponse:
-    user = db.query(User).filter(User.email == payload.email.strip().lower()).first()
-    if not user or not verify_password(payload.password, user.password_hash):
+async def login(payload: LoginRequest, db: Session = Depends(get_db)) -> LoginResponse:
+    user = await run_in_threadpool(_find_user, db, payload.email.strip().lower())
+    if not user:
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+
+    try:
+        valid, new_hash = await verify_and_update_password(payload.password, user.password_hash)
+    except PasswordQueueFull as exc:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many login attempts in progress",
+            headers={"Retry-After": "1"},
+        ) from exc
+    if not valid:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid email or password")
+    if new_hash:
+        await run_in_threadpool(_store_hash, db, user, new_hash)
 
     token = create_access_token(subject=str(user.id), role=user.role.value)
     return LoginResponse(
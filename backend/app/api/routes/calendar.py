@@ -1,39 +1,150 @@
+from collections.abc import Iterator
+from functools import partial
 from datetime import date as date_type, datetime, time, timedelta
+from typing import Literal
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy import case
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user
-from app.api.utils import session_to_out
-from app.db.session import get_db
+from app.api.deps import get_current_user, get_read_db
+from app.api.etag import CACHE_CONTROL, conditional, etag_matches, make_etag
+from app.api.utils import dump_json, json_response
+from app.core.config import settings
+from app.db.session import SessionLocal
 from app.models.enums import SessionStatus, UserRole
 from app.models.session import Session as SessionModel
 from app.schemas.session import SessionOut
+from app.services.day_snapshots import DaySnapshot, day_snapshots
+from app.services.games_catalog import games_catalog
+from app.services.session_out import session_fields
+from app.services.sessions import session_select
+from app.services.versions import calendar_version
 
 router = APIRouter(tags=["calendar"])
 
+STREAM_CHUNK_ROWS = 200
+
+status_order = case(
+    (SessionModel.status == SessionStatus.arrived, 1),
+    (SessionModel.status == SessionStatus.planned, 2),
+    (SessionModel.status == SessionStatus.completed, 3),
+    (SessionModel.status == SessionStatus.canceled, 4),
+    else_=5,
+)
+
+
+def calendar_select(start: datetime, end: datetime, location_id: int | None):
+    query = session_select().where(SessionModel.start_at >= start, SessionModel.start_at < end)
+    if location_id is not None:
+        query = query.where(SessionModel.location_id == location_id)
+    return query.order_by(SessionModel.start_at.asc(), status_order.asc(), SessionModel.id.asc())
+
+
+def day_snapshot_key(date: date_type, location_id: int | None) -> tuple:
+    # Game names are part of the body, so a catalog reload starts new keys.
+    return (location_id, date, games_catalog.version)
+
+
+def build_day_snapshot(date: date_type, location_id: int | None) -> DaySnapshot:
+    # Runs on the snapshot pool, outside any request session.
+    start = datetime.combine(date, time.min)
+    end = start + timedelta(days=1)
+    catalog_version = games_catalog.version
+    with SessionLocal() as db:
+        version = db.execute(calendar_version(start, end, location_id)).one()
+        sessions = db.scalars(calendar_select(start, end, location_id)).all()
+        body = dump_json([session_fields(item) for item in sessions])
+    return DaySnapshot(etag=make_etag("calendar", date, location_id, *catalog_version, *version), body=body)
+
+
+def snapshot_response(request: Request, snapshot: DaySnapshot, stale: bool) -> Response:
+    headers = {"ETag": snapshot.etag, "Cache-Control": CACHE_CONTROL}
+    if stale:
+        headers["X-Calendar-Snapshot"] = "stale"
+    if etag_matches(request, snapshot.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(snapshot.body, media_type="application/json", headers=headers)
+
 
 @router.get("/calendar/day", response_model=list[SessionOut])
 def calendar_day(
+    request: Request,
+    response: Response,
     date: date_type,
-    db: Session = Depends(get_db),
+    db: Session = Depends(get_read_db),
     user=Depends(get_current_user),
 ) -> list[SessionOut]:
     start = datetime.combine(date, time.min)
     end = start + timedelta(days=1)
+    location_id = None if user.role == UserRole.owner else user.location_id
+    if settings.CALENDAR_SNAPSHOT_ENABLED:
+        snapshot, stale = day_snapshots.fetch(
+            day_snapshot_key(date, location_id), partial(build_day_snapshot, date, location_id)
+        )
+        return snapshot_response(request, snapshot, stale)
 
-    status_order = case(
-        (SessionModel.status == SessionStatus.arrived, 1),
-        (SessionModel.status == SessionStatus.planned, 2),
-        (SessionModel.status == SessionStatus.completed, 3),
-        (SessionModel.status == SessionStatus.canceled, 4),
-        else_=5,
-    )
+    version = db.execute(calendar_version(start, end, location_id)).one()
+    etag = make_etag("calendar", date, location_id, *games_catalog.version, *version)
+    not_modified = conditional(request, response, etag)
+    if not_modified:
+        return not_modified
 
-    query = db.query(SessionModel).filter(SessionModel.start_at >= start, SessionModel.start_at < end)
-    if user.role != UserRole.owner:
-        query = query.filter(SessionModel.location_id == user.location_id)
+    sessions = db.scalars(calendar_select(start, end, location_id)).all()
+    return json_response([session_fields(item) for item in sessions], response)
 
-    sessions = query.order_by(SessionModel.start_at.asc(), status_order.asc(), SessionModel.id.asc()).all()
-    return [session_to_out(item) for item in sessions]
+
+def _serialized_batches(rows) -> Iterator[list[str]]:
+    batch: list[str] = []
+    for item in rows:
+        batch.append(dump_json(session_fields(item)).decode())
+        if len(batch) >= STREAM_CHUNK_ROWS:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _iter_range(start: datetime, end: datetime, location_id: int | None, fmt: str) -> Iterator[str]:
+    # The request-scoped session from get_db is closed before the body is sent,
+    # so the stream owns its session for as long as the client keeps reading.
+    with SessionLocal() as db:
+        rows = db.scalars(calendar_select(start, end, location_id).execution_options(yield_per=STREAM_CHUNK_ROWS))
+        batches = _serialized_batches(rows)
+        if fmt == "ndjson":
+            for batch in batches:
+                yield "\n".join(batch) + "\n"
+            return
+
+        yield "["
+        for index, batch in enumerate(batches):
+            yield ("," if index else "") + ",".join(batch)
+        yield "]"
+
+
+def range_bounds(from_date: date_type, to_date: date_type) -> tuple[datetime, datetime]:
+    if to_date < from_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'to' must not be before 'from'")
+    if (to_date - from_date).days + 1 > settings.CALENDAR_RANGE_MAX_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Range is limited to {settings.CALENDAR_RANGE_MAX_DAYS} days",
+        )
+    return datetime.combine(from_date, time.min), datetime.combine(to_date, time.min) + timedelta(days=1)
+
+
+def range_media_type(fmt: str) -> str:
+    return "application/x-ndjson" if fmt == "ndjson" else "application/json"
+
+
+@router.get("/calendar/range")
+def calendar_range(
+    from_date: date_type = Query(alias="from"),
+    to_date: date_type = Query(alias="to"),
+    format: Literal["ndjson", "json"] = "ndjson",
+    user=Depends(get_current_user),
+) -> StreamingResponse:
+    start, end = range_bounds(from_date, to_date)
+    location_id = None if user.role == UserRole.owner else user.location_id
+    return StreamingResponse(_iter_range(start, end, location_id, format), media_type=range_media_type(format))
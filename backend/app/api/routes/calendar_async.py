@@ -0,0 +1,89 @@
+from collections.abc import AsyncIterator
+from datetime import date as date_type, datetime, time, timedelta
+from functools import partial
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, Request, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_read_db, get_current_user_async
+from app.api.etag import conditional, make_etag
+from app.api.routes.calendar import (
+    STREAM_CHUNK_ROWS,
+    build_day_snapshot,
+    calendar_select,
+    day_snapshot_key,
+    range_bounds,
+    range_media_type,
+    snapshot_response,
+)
+from app.api.utils import dump_json, json_response
+from app.core.config import settings
+from app.db import session as db_session
+from app.models.enums import UserRole
+from app.schemas.session import SessionOut
+from app.services.day_snapshots import day_snapshots
+from app.services.games_catalog import games_catalog
+from app.services.session_out import session_fields
+from app.services.versions import calendar_version
+
+router = APIRouter(tags=["calendar"])
+
+
+@router.get("/calendar/day", response_model=list[SessionOut])
+async def calendar_day(
+    request: Request,
+    response: Response,
+    date: date_type,
+    db: AsyncSession = Depends(get_async_read_db),
+    user=Depends(get_current_user_async),
+) -> list[SessionOut]:
+    start = datetime.combine(date, time.min)
+    end = start + timedelta(days=1)
+    location_id = None if user.role == UserRole.owner else user.location_id
+    if settings.CALENDAR_SNAPSHOT_ENABLED:
+        snapshot, stale = await day_snapshots.fetch_async(
+            day_snapshot_key(date, location_id), partial(build_day_snapshot, date, location_id)
+        )
+        return snapshot_response(request, snapshot, stale)
+
+    version = (await db.execute(calendar_version(start, end, location_id))).one()
+    etag = make_etag("calendar", date, location_id, *games_catalog.version, *version)
+    not_modified = conditional(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    sessions = (await db.scalars(calendar_select(start, end, location_id))).all()
+    return json_response([session_fields(item) for item in sessions], response)
+
+
+async def _aiter_range(start: datetime, end: datetime, location_id: int | None, fmt: str) -> AsyncIterator[str]:
+    async with db_session.AsyncSessionLocal() as db:
+        result = await db.stream_scalars(
+            calendar_select(start, end, location_id).execution_options(yield_per=STREAM_CHUNK_ROWS)
+        )
+        first = True
+        if fmt == "json":
+            yield "["
+        async for partition in result.partitions():
+            batch = [dump_json(session_fields(item)).decode() for item in partition]
+            if fmt == "ndjson":
+                yield "\n".join(batch) + "\n"
+            else:
+                yield ("" if first else ",") + ",".join(batch)
+            first = False
+        if fmt == "json":
+            yield "]"
+
+
+@router.get("/calendar/range")
+async def calendar_range(
+    from_date: date_type = Query(alias="from"),
+    to_date: date_type = Query(alias="to"),
+    format: Literal["ndjson", "json"] = "ndjson",
+    user=Depends(get_current_user_async),
+) -> StreamingResponse:
+    start, end = range_bounds(from_date, to_date)
+    location_id = None if user.role == UserRole.owner else user.location_id
+    return StreamingResponse(_aiter_range(start, end, location_id, format), media_type=range_media_type(format))
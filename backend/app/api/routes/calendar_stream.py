@@ -0,0 +1,66 @@
+import asyncio
+import json
+from collections.abc import AsyncIterator
+from datetime import date as date_type, datetime, time, timedelta
+
+from fastapi import APIRouter, Depends, Request
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import get_stream_user
+from app.api.routes.calendar import calendar_select
+from app.core.config import settings
+from app.db.session import SessionLocal
+from app.models.enums import UserRole
+from app.services.events import Subscription, broker
+from app.services.session_out import session_to_out
+
+router = APIRouter(tags=["calendar"])
+
+
+def _load_snapshot(day: date_type, location_id: int | None) -> list[dict]:
+    start = datetime.combine(day, time.min)
+    with SessionLocal() as db:
+        sessions = db.scalars(calendar_select(start, start + timedelta(days=1), location_id)).all()
+        return [session_to_out(item).model_dump(mode="json") for item in sessions]
+
+
+def _sse(event: str, data) -> str:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+async def _stream(
+    request: Request, subscription: Subscription, day: date_type, location_id: int | None
+) -> AsyncIterator[str]:
+    try:
+        yield _sse("snapshot", await run_in_threadpool(_load_snapshot, day, location_id))
+        while not await request.is_disconnected():
+            if subscription.overflowed:
+                # The client fell behind; replace the lost deltas with a fresh snapshot.
+                while not subscription.queue.empty():
+                    subscription.queue.get_nowait()
+                subscription.overflowed = False
+                yield _sse("snapshot", await run_in_threadpool(_load_snapshot, day, location_id))
+                continue
+            try:
+                event = await asyncio.wait_for(
+                    subscription.queue.get(), timeout=settings.CALENDAR_STREAM_KEEPALIVE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            yield _sse("session", event)
+    finally:
+        broker.unsubscribe(subscription)
+
+
+@router.get("/calendar/stream")
+async def calendar_stream(request: Request, date: date_type, user=Depends(get_stream_user)) -> StreamingResponse:
+    location_id = None if user.role == UserRole.owner else user.location_id
+    # Subscribe before the snapshot is read so no change slips in between.
+    subscription = broker.subscribe(location_id, date)
+    return StreamingResponse(
+        _stream(request, subscription, date, location_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -0,0 +1,61 @@
+from datetime import date as date_type, datetime, time, timedelta
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
+
+from app.api.deps import require_owner
+from app.services.export import (
+    AUDIT_COLUMNS,
+    SESSION_COLUMNS,
+    audit_export_select,
+    iter_export,
+    parquet_available,
+    sessions_export_select,
+)
+
+router = APIRouter(prefix="/export", tags=["export"])
+
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "parquet": "application/vnd.apache.parquet"}
+
+
+def export_bounds(from_date: date_type, to_date: date_type, fmt: str) -> tuple[datetime, datetime]:
+    if to_date < from_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'to' must not be before 'from'")
+    if fmt == "parquet" and not parquet_available():
+        raise HTTPException(status_code=status.HTTP_501_NOT_IMPLEMENTED, detail="Parquet export requires pyarrow")
+    return datetime.combine(from_date, time.min), datetime.combine(to_date, time.min) + timedelta(days=1)
+
+
+def export_response(chunks, name: str, from_date: date_type, to_date: date_type, fmt: str) -> StreamingResponse:
+    filename = f"{name}_{from_date.isoformat()}_{to_date.isoformat()}.{fmt}"
+    return StreamingResponse(
+        chunks,
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'},
+    )
+
+
+@router.get("/sessions")
+def export_sessions(
+    from_date: date_type = Query(alias="from"),
+    to_date: date_type = Query(alias="to"),
+    format: Literal["csv", "parquet"] = "csv",
+    location_id: int | None = None,
+    user=Depends(require_owner),
+) -> StreamingResponse:
+    start, end = export_bounds(from_date, to_date, format)
+    chunks = iter_export(sessions_export_select(start, end, location_id), SESSION_COLUMNS, format)
+    return export_response(chunks, "sessions", from_date, to_date, format)
+
+
+@router.get("/audit")
+def export_audit(
+    from_date: date_type = Query(alias="from"),
+    to_date: date_type = Query(alias="to"),
+    format: Literal["csv", "parquet"] = "csv",
+    user=Depends(require_owner),
+) -> StreamingResponse:
+    start, end = export_bounds(from_date, to_date, format)
+    chunks = iter_export(audit_export_select(start, end), AUDIT_COLUMNS, format)
+    return export_response(chunks, "audit", from_date, to_date, format)
@@ -1,24 +1,28 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status
 from sqlalchemy.orm import Session
 
 from app.api.deps import get_current_user, require_owner
+from app.api.etag import conditional, make_etag
 from app.db.session import get_db
 from app.models.game import Game
 from app.schemas.game import GameCreate, GameOut, GameUpdate
+from app.services.games_catalog import games_catalog
 
 router = APIRouter(prefix="/games", tags=["games"])
 
 
 @router.get("", response_model=list[GameOut])
 def list_games(
+    request: Request,
+    response: Response,
     active_only: bool = True,
-    db: Session = Depends(get_db),
     user=Depends(get_current_user),
 ) -> list[GameOut]:
-    query = db.query(Game)
-    if active_only:
-        query = query.filter(Game.is_active.is_(True))
-    return query.order_by(Game.name.asc()).all()
+    etag = make_etag("games", active_only, *games_catalog.version)
+    not_modified = conditional(request, response, etag)
+    if not_modified:
+        return not_modified
+    return games_catalog.all(active_only)
 
 
 @router.post("", response_model=GameOut, status_code=status.HTTP_201_CREATED)
@@ -34,6 +38,7 @@ def create_game(
     db.add(game)
     db.commit()
     db.refresh(game)
+    games_catalog.load(db)
     return game
 
 
@@ -55,6 +60,7 @@ def update_game(
         game.is_active = payload.is_active
     db.commit()
     db.refresh(game)
+    games_catalog.load(db)
     return game
 
 
@@ -69,4 +75,5 @@ def delete_game(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
     db.delete(game)
     db.commit()
+    games_catalog.load(db)
     return {"status": "deleted"}
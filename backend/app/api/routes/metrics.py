@@ -0,0 +1,28 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.metrics import Gauge, register, render_metrics
+from app.core.security import password_queue_depth
+from app.db.replicas import read_replicas
+from app.db.session import engine
+from app.services.audit import audit_sink
+from app.services.day_snapshots import day_snapshots
+
+router = APIRouter()
+
+register(Gauge("password_hash_queue_depth", "Password hash/verify jobs queued or running.", password_queue_depth))
+register(Gauge("audit_sink_pending", "Audit entries committed but not yet written.", audit_sink.depth))
+register(Gauge("db_replicas_usable", "Read replicas within the lag limit.", read_replicas.usable_count))
+register(Gauge("calendar_day_snapshots", "Calendar day snapshots held in memory.", day_snapshots.size))
+register(
+    Gauge(
+        "db_pool_checked_out",
+        "Connections currently checked out of the sync pool.",
+        lambda: getattr(engine.pool, "checkedout", lambda: 0)(),
+    )
+)
+
+
+@router.get("/metrics", response_class=PlainTextResponse, include_in_schema=False)
+def metrics() -> PlainTextResponse:
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
@@ -0,0 +1,153 @@
+from collections import defaultdict
+from datetime import date as date_type, time, timedelta
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.api.deps import require_owner
+from app.db.session import get_db
+from app.models.resource import Resource
+from app.models.session_daily_stats import SessionDailyStats as Stats
+from app.schemas.report import GameReportRow, UtilizationRow
+from app.services.games_catalog import games_catalog
+
+router = APIRouter(prefix="/reports", tags=["reports"])
+
+
+def _rate(part: int, total: int) -> float:
+    return round(part / total, 4) if total else 0.0
+
+
+def _check_range(from_date: date_type, to_date: date_type) -> None:
+    if to_date < from_date:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="'to' must not be before 'from'")
+
+
+def _period_start(day: date_type, group: str) -> date_type:
+    return day - timedelta(days=day.weekday()) if group == "week" else day
+
+
+def _in_range(query, from_date: date_type, to_date: date_type, location_id: int | None):
+    query = query.where(Stats.day >= from_date, Stats.day <= to_date)
+    if location_id is not None:
+        query = query.where(Stats.location_id == location_id)
+    return query
+
+
+@router.get("/utilization", response_model=list[UtilizationRow])
+def utilization(
+    from_date: date_type = Query(alias="from"),
+    to_date: date_type = Query(alias="to"),
+    group: Literal["day", "week"] = "day",
+    location_id: int | None = None,
+    open_at: time = time.min,
+    close_at: time | None = None,
+    db: Session = Depends(get_db),
+    user=Depends(require_owner),
+) -> list[UtilizationRow]:
+    _check_range(from_date, to_date)
+    open_minutes = open_at.hour * 60 + open_at.minute
+    close_minutes = close_at.hour * 60 + close_at.minute if close_at else 24 * 60
+    if close_minutes <= open_minutes:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="close_at must be after open_at")
+    daily_capacity = close_minutes - open_minutes
+
+    resources = db.query(Resource)
+    if location_id is not None:
+        resources = resources.filter(Resource.location_id == location_id)
+    resources = resources.order_by(Resource.id.asc()).all()
+
+    rows = db.execute(
+        _in_range(
+            select(
+                Stats.resource_id,
+                Stats.day,
+                func.sum(Stats.sessions),
+                func.sum(Stats.canceled),
+                func.sum(Stats.completed),
+                func.sum(Stats.booked_minutes),
+            ),
+            from_date,
+            to_date,
+            location_id,
+        ).group_by(Stats.resource_id, Stats.day)
+    ).all()
+
+    totals: dict[tuple[date_type, int], list[int]] = defaultdict(lambda: [0, 0, 0, 0])
+    for resource_id, day, *values in rows:
+        counters = totals[(_period_start(day, group), resource_id)]
+        for index, value in enumerate(values):
+            counters[index] += value or 0
+
+    days_in_period: dict[date_type, int] = defaultdict(int)
+    day = from_date
+    while day <= to_date:
+        days_in_period[_period_start(day, group)] += 1
+        day += timedelta(days=1)
+
+    report = []
+    for period_start, days in days_in_period.items():
+        capacity = daily_capacity * days
+        for resource in resources:
+            sessions, canceled, completed, booked = totals.get((period_start, resource.id), (0, 0, 0, 0))
+            report.append(
+                UtilizationRow(
+                    period_start=period_start,
+                    resource_id=resource.id,
+                    resource_name=resource.name,
+                    sessions=sessions,
+                    canceled=canceled,
+                    completed=completed,
+                    booked_minutes=booked,
+                    capacity_minutes=capacity,
+                    utilization=_rate(booked, capacity),
+                    cancellation_rate=_rate(canceled, sessions),
+                )
+            )
+    return report
+
+
+@router.get("/games", response_model=list[GameReportRow])
+def games(
+    from_date: date_type = Query(alias="from"),
+    to_date: date_type = Query(alias="to"),
+    location_id: int | None = None,
+    db: Session = Depends(get_db),
+    user=Depends(require_owner),
+) -> list[GameReportRow]:
+    _check_range(from_date, to_date)
+    rows = db.execute(
+        _in_range(
+            select(
+                Stats.game_id,
+                func.sum(Stats.sessions),
+                func.sum(Stats.canceled),
+                func.sum(Stats.completed),
+                func.sum(Stats.players),
+                func.sum(Stats.booked_minutes),
+            ),
+            from_date,
+            to_date,
+            location_id,
+        ).group_by(Stats.game_id)
+    ).all()
+
+    report = []
+    for game_id, sessions, canceled, completed, players, booked in rows:
+        game = games_catalog.get(game_id, db)
+        report.append(
+            GameReportRow(
+                game_id=game_id,
+                game_name=game.name if game else "",
+                sessions=sessions,
+                canceled=canceled,
+                completed=completed,
+                players=players,
+                booked_minutes=booked,
+                cancellation_rate=_rate(canceled, sessions),
+            )
+        )
+    report.sort(key=lambda row: (-row.sessions, row.game_name))
+    return report
@@ -1,18 +1,98 @@
-from fastapi import APIRouter, Depends
+from datetime import date as date_type, datetime, time, timedelta
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user
+from app.api.deps import get_current_user, get_read_db
+from app.api.etag import conditional, make_etag
 from app.db.session import get_db
 from app.models.enums import UserRole
 from app.models.resource import Resource
-from app.schemas.resource import ResourceOut
+from app.schemas.resource import FreeSlot, ResourceAvailability, ResourceOut
+from app.services.availability import find_free_slots
+from app.services.sessions import ensure_resource_access
+from app.services.versions import resources_version
 
 router = APIRouter(prefix="/resources", tags=["resources"])
 
 
 @router.get("", response_model=list[ResourceOut])
-def list_resources(db: Session = Depends(get_db), user=Depends(get_current_user)) -> list[ResourceOut]:
+def list_resources(
+    request: Request,
+    response: Response,
+    db: Session = Depends(get_read_db),
+    user=Depends(get_current_user),
+) -> list[ResourceOut]:
+    location_id = None if user.role == UserRole.owner else user.location_id
+    etag = make_etag("resources", location_id, *db.execute(resources_version(location_id)).one())
+    not_modified = conditional(request, response, etag)
+    if not_modified:
+        return not_modified
+
+    query = db.query(Resource)
+    if location_id is not None:
+        query = query.filter(Resource.location_id == location_id)
+    return query.order_by(Resource.id.asc()).all()
+
+
+def _availability(
+    db: Session,
+    resources: list[Resource],
+    date: date_type,
+    duration_min: int,
+    step_min: int | None,
+    open_at: time,
+    close_at: time | None,
+) -> list[ResourceAvailability]:
+    window_start = datetime.combine(date, open_at)
+    window_end = datetime.combine(date, close_at) if close_at else datetime.combine(date, time.min) + timedelta(days=1)
+    if window_end <= window_start:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="close_at must be after open_at")
+
+    step = timedelta(minutes=step_min) if step_min else None
+    slots = find_free_slots(
+        db, [item.id for item in resources], window_start, window_end, timedelta(minutes=duration_min), step
+    )
+    return [
+        ResourceAvailability(
+            resource_id=item.id,
+            resource_name=item.name,
+            slots=[FreeSlot(start_at=start_at, end_at=end_at) for start_at, end_at in slots[item.id]],
+        )
+        for item in resources
+    ]
+
+
+@router.get("/availability", response_model=list[ResourceAvailability])
+def availability_many(
+    date: date_type,
+    duration_min: int = Query(gt=0),
+    resource_ids: list[int] | None = Query(default=None),
+    step_min: int | None = Query(default=None, gt=0),
+    open_at: time = time.min,
+    close_at: time | None = None,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+) -> list[ResourceAvailability]:
     query = db.query(Resource)
     if user.role != UserRole.owner:
         query = query.filter(Resource.location_id == user.location_id)
-    return query.order_by(Resource.id.asc()).all()
+    if resource_ids:
+        query = query.filter(Resource.id.in_(resource_ids))
+    resources = query.order_by(Resource.id.asc()).all()
+    return _availability(db, resources, date, duration_min, step_min, open_at, close_at)
+
+
+@router.get("/{resource_id}/availability", response_model=ResourceAvailability)
+def availability_one(
+    resource_id: int,
+    date: date_type,
+    duration_min: int = Query(gt=0),
+    step_min: int | None = Query(default=None, gt=0),
+    open_at: time = time.min,
+    close_at: time | None = None,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+) -> ResourceAvailability:
+    resource = ensure_resource_access(db, user, resource_id)
+    return _availability(db, [resource], date, duration_min, step_min, open_at, close_at)[0]
@@ -0,0 +1,49 @@
+from dataclasses import asdict
+
+from fastapi import APIRouter, Depends, HTTPException, status
+from sqlalchemy.orm import Session
+
+from app.api.deps import get_current_user
+from app.db.session import get_db
+from app.models.enums import UserRole
+from app.models.session_series import SessionSeries
+from app.schemas.series import (
+    SeriesBase,
+    SeriesConflict,
+    SeriesCreate,
+    SeriesCreated,
+    SeriesOccurrence,
+    SeriesOut,
+    SeriesPreview,
+)
+from app.services.session_out import session_to_out
+from app.services.sessions import create_series, preview_series
+
+router = APIRouter(prefix="/series", tags=["series"])
+
+
+@router.post("/preview", response_model=SeriesPreview)
+def preview(payload: SeriesBase, db: Session = Depends(get_db), user=Depends(get_current_user)) -> SeriesPreview:
+    occurrences, conflicts = preview_series(db, user, payload)
+    return SeriesPreview(
+        occurrences=[SeriesOccurrence(start_at=start_at, end_at=end_at) for start_at, end_at in occurrences],
+        conflicts=[SeriesConflict(**asdict(conflict)) for conflict in conflicts],
+    )
+
+
+@router.post("", response_model=SeriesCreated, status_code=status.HTTP_201_CREATED)
+def create(payload: SeriesCreate, db: Session = Depends(get_db), user=Depends(get_current_user)) -> SeriesCreated:
+    series, sessions, conflicts = create_series(db, user, payload)
+    return SeriesCreated(
+        series=SeriesOut.model_validate(series),
+        sessions=[session_to_out(session) for session in sessions],
+        skipped=[SeriesConflict(**asdict(conflict)) for conflict in conflicts],
+    )
+
+
+@router.get("/{series_id}", response_model=SeriesOut)
+def get_one(series_id: int, db: Session = Depends(get_db), user=Depends(get_current_user)) -> SeriesOut:
+    series = db.get(SessionSeries, series_id)
+    if series is None or (user.role != UserRole.owner and series.location_id != user.location_id):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Series not found")
+    return SeriesOut.model_validate(series)
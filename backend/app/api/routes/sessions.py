@@ -1,23 +1,115 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from datetime import date as date_type, datetime, time, timedelta
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy import Select, tuple_
 from sqlalchemy.orm import Session
 
-from app.api.deps import get_current_user, require_owner
-from app.api.utils import session_to_out
+from app.api.deps import get_current_user, get_read_db, require_owner
+from app.api.pagination import decode_cursor, encode_cursor
+from app.api.utils import bulk_to_out, json_response
 from app.db.session import get_db
-from app.models.enums import UserRole
+from app.models.enums import SessionStatus, UserRole
 from app.models.session import Session as SessionModel
-from app.schemas.session import CancelRequest, DeleteRequest, SessionCreate, SessionOut, SessionUpdate
+from app.schemas.session import (
+    CancelRequest,
+    DeleteRequest,
+    SessionBulkCreate,
+    SessionBulkResult,
+    SessionCreate,
+    SessionOut,
+    SessionPage,
+    SessionUpdate,
+)
+from app.services.session_out import session_fields, session_to_out
 from app.services.sessions import (
+    bulk_create_sessions,
     cancel_session,
     complete_session,
     create_session,
     delete_session,
     ensure_session_access,
+    session_select,
     update_session,
 )
 
 router = APIRouter(prefix="/sessions", tags=["sessions"])
 
+SEARCH_PAGE_MAX = 200
+
+
+def search_select(
+    location_id: int | None,
+    from_date: date_type | None,
+    to_date: date_type | None,
+    statuses: list[SessionStatus] | None,
+    game_id: int | None,
+    resource_id: int | None,
+    contact_phone: str | None,
+    q: str | None,
+    order: str,
+    cursor: str | None,
+    limit: int,
+) -> Select:
+    query = session_select()
+    if location_id is not None:
+        query = query.where(SessionModel.location_id == location_id)
+    if from_date is not None:
+        query = query.where(SessionModel.start_at >= datetime.combine(from_date, time.min))
+    if to_date is not None:
+        query = query.where(SessionModel.start_at < datetime.combine(to_date, time.min) + timedelta(days=1))
+    if statuses:
+        query = query.where(SessionModel.status.in_(statuses))
+    if game_id is not None:
+        query = query.where(SessionModel.game_id == game_id)
+    if resource_id is not None:
+        query = query.where(SessionModel.resource_id == resource_id)
+    if contact_phone:
+        query = query.where(SessionModel.contact_phone.icontains(contact_phone.strip(), autoescape=True))
+    if q:
+        query = query.where(SessionModel.comment.icontains(q.strip(), autoescape=True))
+
+    # Keyset pagination: the next page starts strictly after the last
+    # (start_at, id) returned, so deep pages cost the same as the first one.
+    key = tuple_(SessionModel.start_at, SessionModel.id)
+    if cursor:
+        after = tuple_(*decode_cursor(cursor))
+        query = query.where(key > after if order == "asc" else key < after)
+    if order == "asc":
+        query = query.order_by(SessionModel.start_at.asc(), SessionModel.id.asc())
+    else:
+        query = query.order_by(SessionModel.start_at.desc(), SessionModel.id.desc())
+    # One extra row tells whether another page exists.
+    return query.limit(limit + 1)
+
+
+def search_page(rows: list[SessionModel], limit: int) -> dict:
+    # Serialized as is by json_response; SessionPage documents the shape.
+    next_cursor = encode_cursor(rows[limit - 1].start_at, rows[limit - 1].id) if len(rows) > limit else None
+    return {"items": [session_fields(item) for item in rows[:limit]], "next_cursor": next_cursor}
+
+
+@router.get("", response_model=SessionPage)
+def search(
+    from_date: date_type | None = Query(default=None, alias="from"),
+    to_date: date_type | None = Query(default=None, alias="to"),
+    status_filter: list[SessionStatus] | None = Query(default=None, alias="status"),
+    game_id: int | None = None,
+    resource_id: int | None = None,
+    contact_phone: str | None = Query(default=None, min_length=3),
+    q: str | None = Query(default=None, min_length=3),
+    order: Literal["asc", "desc"] = "asc",
+    cursor: str | None = None,
+    limit: int = Query(default=50, ge=1, le=SEARCH_PAGE_MAX),
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+) -> SessionPage:
+    location_id = None if user.role == UserRole.owner else user.location_id
+    query = search_select(
+        location_id, from_date, to_date, status_filter, game_id, resource_id, contact_phone, q, order, cursor, limit
+    )
+    return json_response(search_page(db.scalars(query).all(), limit))
+
 
 @router.post("", response_model=SessionOut, status_code=status.HTTP_201_CREATED)
 def create(payload: SessionCreate, db: Session = Depends(get_db), user=Depends(get_current_user)) -> SessionOut:
@@ -25,8 +117,17 @@ def create(payload: SessionCreate, db: Session = Depends(get_db), user=Depends(g
     return session_to_out(session)
 
 
+@router.post("/bulk", response_model=SessionBulkResult, status_code=status.HTTP_201_CREATED)
+def create_bulk(
+    payload: SessionBulkCreate,
+    db: Session = Depends(get_db),
+    user=Depends(get_current_user),
+) -> SessionBulkResult:
+    return bulk_to_out(bulk_create_sessions(db, user, payload.items, atomic=payload.atomic))
+
+
 @router.get("/{session_id}", response_model=SessionOut)
-def get_one(session_id: int, db: Session = Depends(get_db), user=Depends(get_current_user)) -> SessionOut:
+def get_one(session_id: int, db: Session = Depends(get_read_db), user=Depends(get_current_user)) -> SessionOut:
     session = ensure_session_access(db, user, session_id)
     return session_to_out(session)
 
@@ -0,0 +1,121 @@
+from datetime import date as date_type
+from typing import Literal
+
+from fastapi import APIRouter, Depends, Query, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.deps import get_async_read_db, get_current_user_async, require_owner_async
+from app.api.routes.sessions import SEARCH_PAGE_MAX, search_page, search_select
+from app.api.utils import bulk_to_out, json_response
+from app.db.session import get_async_db
+from app.models.enums import SessionStatus, UserRole
+from app.schemas.session import (
+    CancelRequest,
+    DeleteRequest,
+    SessionBulkCreate,
+    SessionBulkResult,
+    SessionCreate,
+    SessionOut,
+    SessionPage,
+    SessionUpdate,
+)
+from app.services.session_out import session_to_out
+from app.services.sessions_async import (
+    bulk_create_sessions,
+    cancel_session,
+    complete_session,
+    create_session,
+    delete_session,
+    ensure_session_access,
+    update_session,
+)
+
+router = APIRouter(prefix="/sessions", tags=["sessions"])
+
+
+@router.get("", response_model=SessionPage)
+async def search(
+    from_date: date_type | None = Query(default=None, alias="from"),
+    to_date: date_type | None = Query(default=None, alias="to"),
+    status_filter: list[SessionStatus] | None = Query(default=None, alias="status"),
+    game_id: int | None = None,
+    resource_id: int | None = None,
+    contact_phone: str | None = Query(default=None, min_length=3),
+    q: str | None = Query(default=None, min_length=3),
+    order: Literal["asc", "desc"] = "asc",
+    cursor: str | None = None,
+    limit: int = Query(default=50, ge=1, le=SEARCH_PAGE_MAX),
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user_async),
+) -> SessionPage:
+    location_id = None if user.role == UserRole.owner else user.location_id
+    query = search_select(
+        location_id, from_date, to_date, status_filter, game_id, resource_id, contact_phone, q, order, cursor, limit
+    )
+    return json_response(search_page((await db.scalars(query)).all(), limit))
+
+
+@router.post("", response_model=SessionOut, status_code=status.HTTP_201_CREATED)
+async def create(
+    payload: SessionCreate, db: AsyncSession = Depends(get_async_db), user=Depends(get_current_user_async)
+) -> SessionOut:
+    session = await create_session(db, user, payload)
+    return session_to_out(session)
+
+
+@router.post("/bulk", response_model=SessionBulkResult, status_code=status.HTTP_201_CREATED)
+async def create_bulk(
+    payload: SessionBulkCreate,
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user_async),
+) -> SessionBulkResult:
+    return bulk_to_out(await bulk_create_sessions(db, user, payload.items, atomic=payload.atomic))
+
+
+@router.get("/{session_id}", response_model=SessionOut)
+async def get_one(
+    session_id: int, db: AsyncSession = Depends(get_async_read_db), user=Depends(get_current_user_async)
+) -> SessionOut:
+    session = await ensure_session_access(db, user, session_id)
+    return session_to_out(session)
+
+
+@router.put("/{session_id}", response_model=SessionOut)
+async def update(
+    session_id: int,
+    payload: SessionUpdate,
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user_async),
+) -> SessionOut:
+    session = await update_session(db, user, session_id, payload)
+    return session_to_out(session)
+
+
+@router.post("/{session_id}/cancel", response_model=SessionOut)
+async def cancel(
+    session_id: int,
+    payload: CancelRequest,
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(get_current_user_async),
+) -> SessionOut:
+    session = await cancel_session(db, user, session_id, payload.reason)
+    return session_to_out(session)
+
+
+@router.post("/{session_id}/complete", response_model=SessionOut)
+async def complete(
+    session_id: int, db: AsyncSession = Depends(get_async_db), user=Depends(get_current_user_async)
+) -> SessionOut:
+    session = await complete_session(db, user, session_id)
+    return session_to_out(session)
+
+
+@router.delete("/{session_id}")
+async def delete(
+    session_id: int,
+    payload: DeleteRequest,
+    db: AsyncSession = Depends(get_async_db),
+    user=Depends(require_owner_async),
+) -> dict:
+    await delete_session(db, user, session_id, payload.reason)
+    return {"status": "deleted"}
@@ -1,25 +1,37 @@
+import orjson
+from fastapi import Response
+from fastapi.responses import ORJSONResponse
+
 from app.models.session import Session as SessionModel
-from app.schemas.session import SessionOut
-
-
-def session_to_out(session: SessionModel) -> SessionOut:
-    return SessionOut(
-        id=session.id,
-        location_id=session.location_id,
-        resource_id=session.resource_id,
-        resource_name=session.resource.name if session.resource else "",
-        game_id=session.game_id,
-        game_name=session.game.name if session.game else "",
-        game_icon=session.game.mode_icon if session.game else None,
-        start_at=session.start_at,
-        end_at=session.end_at,
-        duration_min=session.duration_min,
-        status=session.status,
-        players=session.players,
-        contact_name=session.contact_name,
-        contact_phone=session.contact_phone,
-        comment=session.comment,
-        canceled_reason=session.canceled_reason,
-        created_at=session.created_at,
-        updated_at=session.updated_at,
-    )
+from app.schemas.session import SessionBulkItemResult, SessionBulkResult
+from app.services.session_out import session_to_out
+
+# UTC as "Z", the way pydantic writes it on the validated paths.
+ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_UTC_Z
+
+
+def dump_json(content) -> bytes:
+    return orjson.dumps(content, option=ORJSON_OPTIONS)
+
+
+class FastJSONResponse(ORJSONResponse):
+    def render(self, content) -> bytes:
+        return dump_json(content)
+
+
+def json_response(content, response: Response | None = None) -> FastJSONResponse:
+    # Returning a Response skips FastAPI's response_model validation and
+    # jsonable_encoder pass; headers already set on the injected response
+    # (ETag, Cache-Control) are carried over.
+    result = FastJSONResponse(content)
+    if response is not None:
+        result.raw_headers.extend(response.raw_headers)
+    return result
+
+
+def bulk_to_out(outcome: list[tuple[int, SessionModel | None, str | None]]) -> SessionBulkResult:
+    results = [
+        SessionBulkItemResult(index=index, session=session_to_out(session) if session else None, error=error)
+        for index, session, error in outcome
+    ]
+    return SessionBulkResult(created=sum(1 for item in results if item.session), results=results)
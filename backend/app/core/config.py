@@ -8,14 +8,78 @@ class Settings(BaseSettings):
 
     PROJECT_NAME: str = "vr-admin"
     DATABASE_URL: str
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_RECYCLE_SECONDS: int = 1800
+    DB_POOL_TIMEOUT_SECONDS: int = 30
+    ASYNC_DB_ENABLED: bool = False
+    # Comma-separated; reads that opt in go to a replica within the lag limit.
+    DATABASE_REPLICA_URLS: str = ""
+    REPLICA_MAX_LAG_SECONDS: float = 2.0
+    REPLICA_LAG_CHECK_SECONDS: float = 1.0
+    READ_YOUR_WRITES_SECONDS: int = 10
+    # Budget for app.server: 0 asks the server for max_connections. Reserved
+    # connections are left for migrations, cron jobs and psql.
+    DB_MAX_CONNECTIONS: int = 0
+    DB_RESERVED_CONNECTIONS: int = 10
     JWT_SECRET: str
     JWT_ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 60 * 24
     CORS_ORIGINS: str = "*"
+    PRINCIPAL_CACHE_TTL_SECONDS: int = 60
+    PRINCIPAL_CACHE_SIZE: int = 1024
+    BCRYPT_ROUNDS: int = 12
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 64
+
+    SERVER_HOST: str = "127.0.0.1"
+    SERVER_PORT: int = 8000
+    SERVER_WORKERS: int = 0
+    SERVER_MAX_REQUESTS: int = 10000
+    SERVER_MAX_REQUESTS_JITTER: int = 1000
+    SERVER_DRAIN_SECONDS: int = 20
+    SERVER_TIMEOUT_SECONDS: int = 60
+    SERVER_KEEPALIVE_SECONDS: int = 5
+
+    METRICS_ENABLED: bool = True
+
+    CALENDAR_RANGE_MAX_DAYS: int = 62
+    CALENDAR_NOTIFY_ENABLED: bool = False
+    CALENDAR_STREAM_KEEPALIVE_SECONDS: int = 15
+    OVERLAP_INDEX_ENABLED: bool = False
+    GAMES_CATALOG_REFRESH_SECONDS: int = 30
+    # Snapshots are dropped on this worker's writes and on LISTEN events, so
+    # with several workers it needs CALENDAR_NOTIFY_ENABLED; the TTL bounds
+    # staleness from writers that do not notify.
+    CALENDAR_SNAPSHOT_ENABLED: bool = False
+    CALENDAR_SNAPSHOT_SIZE: int = 512
+    CALENDAR_SNAPSHOT_TTL_SECONDS: float = 30.0
+    CALENDAR_SNAPSHOT_WORKERS: int = 4
+    CALENDAR_SNAPSHOT_STALE_WHILE_REVALIDATE: bool = False
+    CALENDAR_SNAPSHOT_STALE_WAIT_SECONDS: float = 0.25
+
+    AUDIT_SINK_ENABLED: bool = False
+    AUDIT_FLUSH_INTERVAL_SECONDS: float = 1.0
+    AUDIT_BATCH_SIZE: int = 500
+    AUDIT_MAX_PENDING: int = 50000
+    AUDIT_DURABLE_ACTIONS: str = "delete"
 
     ADMIN_DEFAULT_LOCATION: str = "   -"
     DEFAULT_RESOURCE_NAME: str = " 160 ?"
 
+    def async_database_url(self, url: str | None = None) -> str:
+        # psycopg 3 ships both drivers, so the sync URL works for the async engine too.
+        url = url or self.DATABASE_URL
+        if url.startswith("postgresql://"):
+            return "postgresql+psycopg://" + url[len("postgresql://"):]
+        return url
+
+    def replica_urls(self) -> list[str]:
+        return [item.strip() for item in (self.DATABASE_REPLICA_URLS or "").split(",") if item.strip()]
+
+    def audit_durable_actions(self) -> set[str]:
+        return {item.strip() for item in (self.AUDIT_DURABLE_ACTIONS or "").split(",") if item.strip()}
+
     def cors_list(self) -> list[str]:
         value = (self.CORS_ORIGINS or "").strip()
         if value == "*":
@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.enums import UserRole
+from app.models.user import User
+
+
+@dataclass(frozen=True)
+class Principal:
+    id: int
+    email: str
+    role: UserRole
+    location_id: int | None
+    is_active: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> Principal:
+        return cls(
+            id=user.id,
+            email=user.email,
+            role=user.role,
+            location_id=user.location_id,
+            is_active=user.is_active,
+        )
+
+
+PRINCIPALS_CHANNEL = "principal_changes"
+
+# Keyed by user id (the token "sub"). On PostgreSQL every worker drops its
+# copies when a user change is announced on PRINCIPALS_CHANNEL (the calendar
+# broker's listener consumes it); otherwise they expire with the TTL.
+principal_cache: TTLCache[Principal] = TTLCache(
+    maxsize=settings.PRINCIPAL_CACHE_SIZE, ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS
+)
+
+
+def publish_principal_change(db: Session, user_id: int) -> None:
+    # Call after committing a change to a user's role, location or status.
+    principal_cache.clear()
+    if db.get_bind().dialect.name != "postgresql":
+        return
+    db.execute(select(func.pg_notify(PRINCIPALS_CHANNEL, str(user_id))))
+    db.commit()
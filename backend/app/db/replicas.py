@@ -0,0 +1,126 @@
+from __future__ import annotations
+
+import asyncio
+import itertools
+import logging
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.metrics import TimedAsyncQueuePool, TimedQueuePool, instrument_engine
+from app.db.session import _engine_options
+
+logger = logging.getLogger(__name__)
+
+# Lag is zero while the WAL receiver is streaming and the replica has replayed
+# everything it received, so an idle primary does not read as lag. A stalled or
+# disconnected receiver has also replayed all it received, so without streaming
+# the age of the last replayed transaction counts instead; NULL until the first
+# transaction is replayed. The replay position serves clients that ask for a
+# minimum LSN.
+LAG_QUERY = text(
+    "SELECT CASE WHEN pg_last_wal_receive_lsn() = pg_last_wal_replay_lsn() "
+    "AND EXISTS (SELECT 1 FROM pg_stat_wal_receiver WHERE status = 'streaming') THEN 0 "
+    "ELSE EXTRACT(EPOCH FROM now() - pg_last_xact_replay_timestamp()) END, "
+    "pg_last_wal_replay_lsn()::text"
+)
+
+
+def parse_lsn(value: str) -> int:
+    # "16/B374D848" -> a comparable integer.
+    high, low = value.split("/")
+    return (int(high, 16) << 32) | int(low, 16)
+
+
+class Replica:
+    def __init__(self, url: str) -> None:
+        self.url = url
+        self.engine = create_engine(url, **_engine_options(url, TimedQueuePool))
+        self.SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=self.engine)
+        self.async_engine = None
+        self.AsyncSessionLocal = None
+        if settings.ASYNC_DB_ENABLED:
+            async_url = settings.async_database_url(url)
+            self.async_engine = create_async_engine(async_url, **_engine_options(async_url, TimedAsyncQueuePool))
+            self.AsyncSessionLocal = async_sessionmaker(
+                self.async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+            )
+        if settings.METRICS_ENABLED:
+            instrument_engine(self.engine)
+            if self.async_engine is not None:
+                instrument_engine(self.async_engine.sync_engine)
+        # Unknown until the first check, and again after a failed one.
+        self.lag: float | None = None
+        self.replayed: int | None = None
+
+    def check(self) -> None:
+        if not self.url.startswith("postgresql"):
+            self.lag = 0.0
+            return
+        try:
+            with self.engine.connect() as conn:
+                lag, replayed = conn.execute(LAG_QUERY).one()
+        except Exception:
+            logger.warning("replica lag check failed for %s", self.engine.url, exc_info=True)
+            lag = replayed = None
+        self.lag = None if lag is None else float(lag)
+        self.replayed = None if replayed is None else parse_lsn(replayed)
+
+    @property
+    def usable(self) -> bool:
+        return self.lag is not None and self.lag <= settings.REPLICA_MAX_LAG_SECONDS
+
+    def reached(self, lsn: int | None) -> bool:
+        # Judged by the last check, so a replica that caught up since then is
+        # skipped until the next one; never the other way round.
+        return lsn is None or (self.replayed is not None and self.replayed >= lsn)
+
+
+# Lag is measured by a background task per worker, so picking a replica never
+# waits on the network. Reads fall back to the primary when none is usable.
+class ReadReplicas:
+    def __init__(self, urls: list[str]) -> None:
+        self.replicas = [Replica(url) for url in urls]
+        self._turn = itertools.count()
+        self._checker: asyncio.Task | None = None
+
+    def usable_count(self) -> int:
+        return sum(replica.usable for replica in self.replicas)
+
+    def pick(self, min_lsn: int | None = None) -> Replica | None:
+        usable = [replica for replica in self.replicas if replica.usable and replica.reached(min_lsn)]
+        if not usable:
+            return None
+        return usable[next(self._turn) % len(usable)]
+
+    def check(self) -> None:
+        for replica in self.replicas:
+            replica.check()
+
+    async def start(self) -> None:
+        if not self.replicas:
+            return
+        await asyncio.to_thread(self.check)
+        self._checker = asyncio.create_task(self._check_forever())
+
+    async def stop(self) -> None:
+        if self._checker is not None:
+            self._checker.cancel()
+            try:
+                await self._checker
+            except asyncio.CancelledError:
+                pass
+            self._checker = None
+
+    async def _check_forever(self) -> None:
+        while True:
+            await asyncio.sleep(settings.REPLICA_LAG_CHECK_SECONDS)
+            try:
+                await asyncio.to_thread(self.check)
+            except Exception:
+                logger.exception("replica lag check failed")
+
+
+read_replicas = ReadReplicas(settings.replica_urls())
@@ -1,22 +1,76 @@
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
-from app.api.routes import auth, calendar, games, health, resources, sessions
+from app.api.routes import (
+    audit,
+    auth,
+    calendar,
+    calendar_async,
+    calendar_stream,
+    export,
+    games,
+    health,
+    metrics,
+    reports,
+    resources,
+    series,
+    sessions,
+    sessions_async,
+)
+from app.api.read_your_writes import HEADER_NAME as READ_PRIMARY_HEADER, ReadYourWritesMiddleware
+from app.api.utils import FastJSONResponse
 from app.core.config import settings
+from app.core.metrics import MetricsMiddleware
+from app.db.replicas import read_replicas
+from app.services.audit import audit_sink
+from app.services.events import broker
+from app.services.games_catalog import games_catalog
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    await games_catalog.start()
+    await broker.start()
+    await read_replicas.start()
+    yield
+    await read_replicas.stop()
+    await broker.stop()
+    await games_catalog.stop()
+    await asyncio.to_thread(audit_sink.stop)
+
 
-app = FastAPI(title=settings.PROJECT_NAME)
+app = FastAPI(title=settings.PROJECT_NAME, lifespan=lifespan, default_response_class=FastJSONResponse)
 
 app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.cors_list(),
     allow_credentials=True,
     allow_methods=["*"],
-    allow_headers=["*"]
+    allow_headers=["*"],
+    expose_headers=[READ_PRIMARY_HEADER],
 )
+if read_replicas.replicas:
+    app.add_middleware(ReadYourWritesMiddleware)
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
 
 app.include_router(health.router)
+if settings.METRICS_ENABLED:
+    app.include_router(metrics.router)
 app.include_router(auth.router)
 app.include_router(games.router)
 app.include_router(resources.router)
-app.include_router(calendar.router)
-app.include_router(sessions.router)
+app.include_router(reports.router)
+app.include_router(series.router)
+app.include_router(export.router)
+app.include_router(audit.router)
+app.include_router(calendar_stream.router)
+if settings.ASYNC_DB_ENABLED:
+    app.include_router(calendar_async.router)
+    app.include_router(sessions_async.router)
+else:
+    app.include_router(calendar.router)
+    app.include_router(sessions.router)
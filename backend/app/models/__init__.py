@@ -4,6 +4,8 @@ from app.models.group import Group
 from app.models.location import Location
 from app.models.resource import Resource
 from app.models.session import Session
+from app.models.session_daily_stats import SessionDailyStats
+from app.models.session_series import SessionSeries
 from app.models.user import User
 
 __all__ = [
@@ -13,5 +15,7 @@ __all__ = [
     "Location",
     "Resource",
     "Session",
+    "SessionDailyStats",
+    "SessionSeries",
     "User",
 ]
@@ -11,3 +11,8 @@ class SessionStatus(str, Enum):
     arrived = "arrived"
     completed = "completed"
     canceled = "canceled"
+
+
+class SeriesFrequency(str, Enum):
+    daily = "daily"
+    weekly = "weekly"
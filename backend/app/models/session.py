@@ -12,6 +12,9 @@ class Session(Base):
     location_id: Mapped[int] = mapped_column(Integer, ForeignKey("locations.id"), nullable=False)
     resource_id: Mapped[int] = mapped_column(Integer, ForeignKey("resources.id"), nullable=False)
     game_id: Mapped[int] = mapped_column(Integer, ForeignKey("games.id"), nullable=False)
+    series_id: Mapped[int | None] = mapped_column(
+        Integer, ForeignKey("session_series.id", ondelete="SET NULL"), nullable=True
+    )
 
     start_at: Mapped[DateTime] = mapped_column(DateTime(), nullable=False)
     end_at: Mapped[DateTime] = mapped_column(DateTime(), nullable=False)
@@ -39,5 +42,6 @@ class Session(Base):
     location = relationship("Location", back_populates="sessions")
     resource = relationship("Resource", back_populates="sessions")
     game = relationship("Game", back_populates="sessions")
+    series = relationship("SessionSeries", back_populates="sessions")
     created_by = relationship("User", foreign_keys=[created_by_id], back_populates="created_sessions")
     updated_by = relationship("User", foreign_keys=[updated_by_id], back_populates="updated_sessions")
@@ -0,0 +1,21 @@
+from datetime import date
+
+from sqlalchemy import Date, ForeignKey, Integer
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.db.base import Base
+
+
+class SessionDailyStats(Base):
+    __tablename__ = "session_daily_stats"
+
+    location_id: Mapped[int] = mapped_column(Integer, ForeignKey("locations.id"), primary_key=True)
+    resource_id: Mapped[int] = mapped_column(Integer, ForeignKey("resources.id"), primary_key=True)
+    game_id: Mapped[int] = mapped_column(Integer, ForeignKey("games.id"), primary_key=True)
+    day: Mapped[date] = mapped_column(Date, primary_key=True)
+
+    sessions: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    canceled: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    completed: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    booked_minutes: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
+    players: Mapped[int] = mapped_column(Integer, nullable=False, default=0)
@@ -0,0 +1,42 @@
+from sqlalchemy import JSON, Date, DateTime, Enum as SqlEnum, ForeignKey, Integer, String, Text, Time, func
+from sqlalchemy.orm import Mapped, mapped_column, relationship
+
+from app.db.base import Base
+from app.models.enums import SeriesFrequency
+
+
+# A recurring booking; its occurrences are materialized as ordinary sessions
+# that point back here through sessions.series_id.
+class SessionSeries(Base):
+    __tablename__ = "session_series"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    location_id: Mapped[int] = mapped_column(Integer, ForeignKey("locations.id"), nullable=False)
+    resource_id: Mapped[int] = mapped_column(Integer, ForeignKey("resources.id"), nullable=False)
+    game_id: Mapped[int] = mapped_column(Integer, ForeignKey("games.id"), nullable=False)
+
+    frequency: Mapped[SeriesFrequency] = mapped_column(
+        SqlEnum(SeriesFrequency, name="series_frequency"), nullable=False
+    )
+    interval: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    # ISO weekdays for weekly series, Monday is 1.
+    weekdays: Mapped[list[int]] = mapped_column(JSON, nullable=False, default=list)
+    start_date: Mapped[Date] = mapped_column(Date, nullable=False)
+    until_date: Mapped[Date | None] = mapped_column(Date, nullable=True)
+    count: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    start_time: Mapped[Time] = mapped_column(Time, nullable=False)
+    duration_min: Mapped[int] = mapped_column(Integer, nullable=False)
+    # ISO dates that are skipped, like RRULE EXDATE.
+    exceptions: Mapped[list[str]] = mapped_column(JSON, nullable=False, default=list)
+
+    players: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    contact_name: Mapped[str | None] = mapped_column(String(255), nullable=True)
+    contact_phone: Mapped[str | None] = mapped_column(String(64), nullable=True)
+    comment: Mapped[str | None] = mapped_column(Text, nullable=True)
+
+    created_by_id: Mapped[int | None] = mapped_column(Integer, ForeignKey("users.id"), nullable=True)
+    created_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now())
+    updated_at: Mapped[DateTime] = mapped_column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+    resource = relationship("Resource")
+    sessions = relationship("Session", back_populates="series")
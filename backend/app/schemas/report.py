@@ -0,0 +1,27 @@
+from datetime import date
+
+from pydantic import BaseModel
+
+
+class UtilizationRow(BaseModel):
+    period_start: date
+    resource_id: int
+    resource_name: str
+    sessions: int
+    canceled: int
+    completed: int
+    booked_minutes: int
+    capacity_minutes: int
+    utilization: float
+    cancellation_rate: float
+
+
+class GameReportRow(BaseModel):
+    game_id: int
+    game_name: str
+    sessions: int
+    canceled: int
+    completed: int
+    players: int
+    booked_minutes: int
+    cancellation_rate: float
@@ -1,3 +1,5 @@
+from datetime import datetime
+
 from pydantic import BaseModel, ConfigDict
 
 
@@ -7,3 +9,14 @@ class ResourceOut(BaseModel):
     id: int
     location_id: int
     name: str
+
+
+class FreeSlot(BaseModel):
+    start_at: datetime
+    end_at: datetime
+
+
+class ResourceAvailability(BaseModel):
+    resource_id: int
+    resource_name: str
+    slots: list[FreeSlot]
@@ -0,0 +1,62 @@
+from datetime import date, datetime, time
+
+from pydantic import BaseModel, ConfigDict, Field
+
+from app.models.enums import SeriesFrequency
+from app.schemas.session import SessionOut
+
+
+class SeriesBase(BaseModel):
+    resource_id: int
+    game_id: int
+    frequency: SeriesFrequency = SeriesFrequency.weekly
+    interval: int = Field(default=1, ge=1, le=52)
+    # ISO weekdays (Monday is 1); weekly series default to the start date's weekday.
+    weekdays: list[int] = Field(default_factory=list, max_length=7)
+    start_date: date
+    until_date: date | None = None
+    count: int | None = Field(default=None, ge=1)
+    start_time: time
+    duration_min: int = Field(gt=0, le=24 * 60)
+    exceptions: list[date] = Field(default_factory=list)
+    players: int | None = Field(default=None, ge=1)
+    contact_name: str | None = None
+    contact_phone: str | None = None
+    comment: str | None = None
+
+
+class SeriesCreate(SeriesBase):
+    # Book the free occurrences and report the rest instead of failing.
+    skip_conflicts: bool = False
+
+
+class SeriesOut(SeriesBase):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    location_id: int
+    created_at: datetime
+
+
+class SeriesOccurrence(BaseModel):
+    start_at: datetime
+    end_at: datetime
+
+
+class SeriesConflict(BaseModel):
+    start_at: datetime
+    end_at: datetime
+    session_id: int
+    session_start_at: datetime
+    session_end_at: datetime
+
+
+class SeriesPreview(BaseModel):
+    occurrences: list[SeriesOccurrence]
+    conflicts: list[SeriesConflict]
+
+
+class SeriesCreated(BaseModel):
+    series: SeriesOut
+    sessions: list[SessionOut]
+    skipped: list[SeriesConflict]
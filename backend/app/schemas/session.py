@@ -41,6 +41,7 @@ class SessionOut(BaseModel):
     resource_id: int
     resource_name: str
     game_id: int
+    series_id: int | None = None
     game_name: str
     game_icon: str | None
     start_at: datetime
@@ -56,6 +57,27 @@ class SessionOut(BaseModel):
     updated_at: datetime | None
 
 
+class SessionBulkCreate(BaseModel):
+    items: list[SessionCreate] = Field(min_length=1, max_length=200)
+    atomic: bool = True
+
+
+class SessionBulkItemResult(BaseModel):
+    index: int
+    session: SessionOut | None = None
+    error: str | None = None
+
+
+class SessionBulkResult(BaseModel):
+    created: int
+    results: list[SessionBulkItemResult]
+
+
+class SessionPage(BaseModel):
+    items: list[SessionOut]
+    next_cursor: str | None = None
+
+
 class CancelRequest(BaseModel):
     reason: str = Field(min_length=2)
 
@@ -0,0 +1,25 @@
+import argparse
+from datetime import date
+
+from app.db.session import SessionLocal
+from app.services.audit_partitions import detach_partitions, ensure_partitions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Create upcoming audit_logs partitions and detach old ones")
+    parser.add_argument("--months-ahead", type=int, default=3)
+    parser.add_argument("--retain-months", type=int, help="detach partitions older than this many months")
+    parser.add_argument("--drop", action="store_true", help="drop detached partitions instead of keeping them")
+    args = parser.parse_args()
+
+    today = date.today()
+    with SessionLocal() as db:
+        for name in ensure_partitions(db, today, args.months_ahead):
+            print(f"Created {name}")
+        if args.retain_months is not None:
+            for name in detach_partitions(db, today, args.retain_months, drop=args.drop):
+                print(f"{'Dropped' if args.drop else 'Detached'} {name}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,12 @@
+from app.db.session import SessionLocal
+from app.services.stats import rebuild_stats
+
+
+def backfill_stats() -> int:
+    with SessionLocal() as db:
+        return rebuild_stats(db)
+
+
+if __name__ == "__main__":
+    rows = backfill_stats()
+    print(f"Session stats rebuilt: {rows} rows")
@@ -2,6 +2,7 @@ import argparse
 
 from sqlalchemy import select
 
+from app.core.principals import publish_principal_change
 from app.core.security import hash_password
 from app.db.session import SessionLocal
 from app.models.enums import UserRole
@@ -21,6 +22,7 @@ def create_owner(email: str, password: str) -> User:
             existing.location_id = location.id
             db.commit()
             db.refresh(existing)
+            publish_principal_change(db, existing.id)
             return existing
 
         owner = User(
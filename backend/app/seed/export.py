@@ -0,0 +1,50 @@
+import argparse
+import sys
+from datetime import date, datetime, time, timedelta
+
+from app.services.export import (
+    AUDIT_COLUMNS,
+    SESSION_COLUMNS,
+    audit_export_select,
+    iter_export,
+    parquet_available,
+    sessions_export_select,
+)
+
+
+def export(kind: str, from_date: date, to_date: date, fmt: str, output, location_id: int | None = None) -> None:
+    start = datetime.combine(from_date, time.min)
+    end = datetime.combine(to_date, time.min) + timedelta(days=1)
+    if kind == "sessions":
+        statement, columns = sessions_export_select(start, end, location_id), SESSION_COLUMNS
+    else:
+        statement, columns = audit_export_select(start, end), AUDIT_COLUMNS
+    for chunk in iter_export(statement, columns, fmt):
+        output.write(chunk.encode("utf-8") if isinstance(chunk, str) else chunk)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Export sessions or audit logs to CSV or Parquet")
+    parser.add_argument("kind", choices=["sessions", "audit"])
+    parser.add_argument("--from", dest="from_date", required=True, type=date.fromisoformat)
+    parser.add_argument("--to", dest="to_date", required=True, type=date.fromisoformat)
+    parser.add_argument("--format", choices=["csv", "parquet"], default="csv")
+    parser.add_argument("--location-id", type=int)
+    parser.add_argument("--output", default="-", help="file path, or - for stdout")
+    args = parser.parse_args()
+
+    if args.to_date < args.from_date:
+        parser.error("--to must not be before --from")
+    if args.format == "parquet" and not parquet_available():
+        parser.error("Parquet export requires pyarrow")
+
+    if args.output == "-":
+        export(args.kind, args.from_date, args.to_date, args.format, sys.stdout.buffer, args.location_id)
+        return
+    with open(args.output, "wb") as output:
+        export(args.kind, args.from_date, args.to_date, args.format, output, args.location_id)
+    print(f"Exported {args.kind} to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
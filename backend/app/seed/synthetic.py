@@ -0,0 +1,404 @@
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as time_type, timedelta, timezone
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from app.core.principals import principal_cache
+from app.core.security import hash_password
+from app.db.session import SessionLocal
+from app.models.audit_log import AuditLog
+from app.models.enums import SessionStatus, UserRole
+from app.models.game import Game
+from app.models.location import Location
+from app.models.resource import Resource
+from app.models.session import Session as SessionModel
+from app.models.session_daily_stats import SessionDailyStats
+from app.models.user import User
+from app.services.audit_partitions import ensure_partitions
+from app.services.stats import rebuild_stats
+
+BATCH_ROWS = 5000
+OPEN_AT = time_type(10, 0)
+CLOSE_AT = time_type(22, 0)
+DURATIONS = (30, 60, 60, 90, 120)
+GAPS = (0, 0, 30, 60)
+STATUS_WEIGHTS = (
+    (SessionStatus.completed, 55),
+    (SessionStatus.planned, 30),
+    (SessionStatus.canceled, 10),
+    (SessionStatus.arrived, 5),
+)
+CANCEL_REASONS = ("Client canceled", "Rescheduled", "No answer", "Maintenance")
+CONTACT_NAMES = ("Alexey", "Maria", "Dmitry", "Anna", "Ivan", "Ekaterina", "Sergey", "Olga")
+COMMENTS = ("Birthday", "Corporate event", "Regular client", "Pays on site")
+
+SESSION_COLUMNS = (
+    "id",
+    "location_id",
+    "resource_id",
+    "game_id",
+    "start_at",
+    "end_at",
+    "duration_min",
+    "status",
+    "players",
+    "contact_name",
+    "contact_phone",
+    "comment",
+    "canceled_reason",
+    "canceled_at",
+    "completed_at",
+    "created_by_id",
+    "updated_by_id",
+    "created_at",
+    "updated_at",
+)
+AUDIT_COLUMNS = ("user_id", "entity_type", "entity_id", "action", "changes", "created_at")
+
+
+@dataclass
+class SyntheticSummary:
+    first_day: date
+    days: int = 0
+    location_ids: list[int] = field(default_factory=list)
+    resource_ids: list[int] = field(default_factory=list)
+    game_ids: list[int] = field(default_factory=list)
+    first_session_id: int = 0
+    sessions: int = 0
+    audit_entries: int = 0
+
+    @property
+    def last_day(self) -> date:
+        return self.first_day + timedelta(days=self.days - 1)
+
+    @property
+    def session_ids(self) -> range:
+        return range(self.first_session_id, self.first_session_id + self.sessions)
+
+
+class Progress:
+    def __init__(self, label: str, total: int, enabled: bool) -> None:
+        self.label = label
+        self.total = total
+        self.enabled = enabled
+        self.started = time.perf_counter()
+
+    def update(self, done: int, extra: str = "") -> None:
+        if not self.enabled:
+            return
+        elapsed = max(time.perf_counter() - self.started, 1e-6)
+        percent = 100 * done / self.total if self.total else 100
+        sys.stderr.write(f"\r{self.label}: {done}/{self.total} ({percent:.0f}%) {done / elapsed:.0f} rows/s{extra}")
+        sys.stderr.flush()
+
+    def finish(self) -> None:
+        if self.enabled:
+            sys.stderr.write("\n")
+
+
+# Buffers rows and writes them in batches: COPY on PostgreSQL, multi-row
+# inserts elsewhere. Each batch is committed on its own.
+class BatchLoader:
+    def __init__(self, db: Session, table, columns: tuple[str, ...], before_write=None) -> None:
+        self.db = db
+        self.table = table
+        self.columns = columns
+        self.before_write = before_write
+        self.copy = db.get_bind().dialect.name == "postgresql"
+        self.rows: list[tuple] = []
+        self.written = 0
+
+    def add(self, row: tuple) -> bool:
+        self.rows.append(row)
+        if len(self.rows) >= BATCH_ROWS:
+            self.flush()
+            return True
+        return False
+
+    def flush(self) -> None:
+        if not self.rows:
+            return
+        if self.before_write is not None:
+            self.before_write(self.rows)
+        if self.copy:
+            self._copy()
+        else:
+            self.db.execute(insert(self.table), [dict(zip(self.columns, row)) for row in self.rows])
+        self.db.commit()
+        self.written += len(self.rows)
+        self.rows = []
+
+    def _copy(self) -> None:
+        driver_connection = self.db.connection().connection.driver_connection
+        json_index = self.columns.index("changes") if "changes" in self.columns else None
+        with driver_connection.cursor() as cursor:
+            with cursor.copy(f"COPY {self.table.name} ({', '.join(self.columns)}) FROM STDIN") as copy:
+                for row in self.rows:
+                    if json_index is not None:
+                        row = (*row[:json_index], json.dumps(row[json_index]), *row[json_index + 1 :])
+                    copy.write_row(row)
+
+
+def _reset(db: Session) -> None:
+    if db.get_bind().dialect.name == "postgresql":
+        db.execute(
+            text(
+                "TRUNCATE audit_logs, session_daily_stats, sessions, users, resources, games, locations "
+                "RESTART IDENTITY CASCADE"
+            )
+        )
+    else:
+        for model in (AuditLog, SessionDailyStats, SessionModel, User, Resource, Game, Location):
+            db.execute(delete(model))
+    db.commit()
+    principal_cache.clear()
+
+
+def _audit_partitioned(db: Session) -> bool:
+    if db.get_bind().dialect.name != "postgresql":
+        return False
+    return bool(
+        db.scalar(text("SELECT 1 FROM pg_partitioned_table WHERE partrelid = CAST('audit_logs' AS regclass)"))
+    )
+
+
+def _day_slots(rng: random.Random, day: date) -> list[tuple[datetime, int]]:
+    # Back to back bookings with random gaps, never overlapping on a resource.
+    slots = []
+    cursor = datetime.combine(day, OPEN_AT)
+    close = datetime.combine(day, CLOSE_AT)
+    while True:
+        cursor += timedelta(minutes=rng.choice(GAPS))
+        duration = rng.choice(DURATIONS)
+        if cursor + timedelta(minutes=duration) > close:
+            return slots
+        slots.append((cursor, duration))
+        cursor += timedelta(minutes=duration)
+
+
+def _session_history(
+    rng: random.Random, session_id: int, start_at: datetime, duration: int, status: SessionStatus, user_id: int
+) -> tuple[dict, list[tuple]]:
+    # Booking times are naive local time; audit timestamps are stored in UTC.
+    end_at = start_at + timedelta(minutes=duration)
+    created_at = (start_at - timedelta(hours=rng.randint(2, 24 * 21))).replace(tzinfo=timezone.utc)
+    values = {
+        "players": rng.randint(1, 8),
+        "contact_name": rng.choice(CONTACT_NAMES),
+        "contact_phone": f"+7900{rng.randint(0, 9999999):07d}",
+        "comment": rng.choice(COMMENTS) if rng.random() < 0.2 else None,
+        "canceled_reason": None,
+        "canceled_at": None,
+        "completed_at": None,
+        "created_at": created_at,
+        "updated_at": created_at,
+    }
+    audit = [(user_id, "session", session_id, "create", {}, created_at)]
+
+    if rng.random() < 0.2:
+        players = rng.randint(1, 8)
+        changed_at = created_at + (start_at.replace(tzinfo=timezone.utc) - created_at) * rng.random()
+        audit.append(
+            (user_id, "session", session_id, "update", {"players": {"from": values["players"], "to": players}}, changed_at)
+        )
+        values["players"] = players
+        values["updated_at"] = changed_at
+    if status == SessionStatus.canceled:
+        reason = rng.choice(CANCEL_REASONS)
+        canceled_at = values["updated_at"] + (start_at.replace(tzinfo=timezone.utc) - values["updated_at"]) * rng.random()
+        values.update(canceled_reason=reason, canceled_at=canceled_at.replace(tzinfo=None), updated_at=canceled_at)
+        audit.append((user_id, "session", session_id, "cancel", {"reason": reason}, canceled_at))
+    elif status == SessionStatus.arrived:
+        arrived_at = start_at.replace(tzinfo=timezone.utc)
+        values["updated_at"] = arrived_at
+        audit.append(
+            (user_id, "session", session_id, "update", {"status": {"from": "planned", "to": "arrived"}}, arrived_at)
+        )
+    elif status == SessionStatus.completed:
+        values.update(completed_at=end_at, updated_at=end_at.replace(tzinfo=timezone.utc))
+        audit.append((user_id, "session", session_id, "complete", {}, values["updated_at"]))
+    return values, audit
+
+
+def generate(
+    db: Session,
+    locations: int = 3,
+    resources_per_location: int = 4,
+    games: int = 12,
+    sessions: int = 100000,
+    first_day: date = date(2025, 1, 1),
+    seed: int = 1,
+    owner_email: str = "synthetic-owner@example.com",
+    password: str = "synthetic",
+    audit: bool = True,
+    reset: bool = False,
+    progress: bool = True,
+) -> SyntheticSummary:
+    if min(locations, resources_per_location, games) < 1 or sessions < 0:
+        raise ValueError("locations, resources_per_location and games must be >= 1 and sessions >= 0")
+    rng = random.Random(seed)
+    if reset:
+        _reset(db)
+
+    # New locations and resources every run, so appended bookings can never
+    # collide with existing ones.
+    location_base = db.scalar(select(func.count(Location.id)))
+    location_rows = [Location(name=f"Synthetic location {location_base + index + 1}") for index in range(locations)]
+    db.add_all(location_rows)
+    db.flush()
+    resource_rows = [
+        Resource(location_id=location.id, name=f"Resource {location.id}.{index + 1}")
+        for location in location_rows
+        for index in range(resources_per_location)
+    ]
+    if not resource_rows:
+        raise ValueError("no resources to book sessions on")
+    db.add_all(resource_rows)
+
+    game_ids = list(db.scalars(select(Game.id).where(Game.is_active.is_(True)).order_by(Game.id)))
+    if not game_ids:
+        game_rows = [Game(name=f"Synthetic game {index + 1}", mode_icon=None) for index in range(games)]
+        db.add_all(game_rows)
+        db.flush()
+        game_ids = [game.id for game in game_rows]
+
+    password_hash = hash_password(password)
+    owner = db.scalar(select(User).where(User.email == owner_email))
+    if owner is None:
+        owner = User(email=owner_email, password_hash=password_hash, role=UserRole.owner)
+        db.add(owner)
+    db.add_all(
+        User(email=f"synthetic-admin-{location.id}@example.com", password_hash=password_hash, location_id=location.id)
+        for location in location_rows
+    )
+    db.commit()
+
+    summary = SyntheticSummary(
+        first_day=first_day,
+        location_ids=[location.id for location in location_rows],
+        resource_ids=[resource.id for resource in resource_rows],
+        game_ids=game_ids,
+        first_session_id=(db.scalar(select(func.max(SessionModel.id))) or 0) + 1,
+    )
+    admins = {
+        user.location_id: user.id
+        for user in db.scalars(select(User).where(User.location_id.in_(summary.location_ids)))
+    }
+
+    partitioned = audit and _audit_partitioned(db)
+    months: set[date] = set()
+
+    def ensure_months(rows: list[tuple]) -> None:
+        for month in {row[-1].date().replace(day=1) for row in rows} - months:
+            ensure_partitions(db, month, 0)
+            months.add(month)
+
+    session_loader = BatchLoader(db, SessionModel.__table__, SESSION_COLUMNS)
+    audit_loader = BatchLoader(db, AuditLog.__table__, AUDIT_COLUMNS, ensure_months if partitioned else None)
+    statuses = [status for status, _ in STATUS_WEIGHTS]
+    weights = [weight for _, weight in STATUS_WEIGHTS]
+    meter = Progress("sessions", sessions, progress)
+
+    session_id = summary.first_session_id
+    day = first_day
+    while summary.sessions < sessions:
+        for resource in resource_rows:
+            user_id = rng.choice((owner.id, admins[resource.location_id]))
+            for start_at, duration in _day_slots(rng, day):
+                if summary.sessions >= sessions:
+                    break
+                status = rng.choices(statuses, weights)[0]
+                values, history = _session_history(rng, session_id, start_at, duration, status, user_id)
+                row = {
+                    **values,
+                    "id": session_id,
+                    "location_id": resource.location_id,
+                    "resource_id": resource.id,
+                    "game_id": rng.choice(game_ids),
+                    "start_at": start_at,
+                    "end_at": start_at + timedelta(minutes=duration),
+                    "duration_min": duration,
+                    "status": status.value,
+                    "created_by_id": user_id,
+                    "updated_by_id": user_id,
+                }
+                if session_loader.add(tuple(row[name] for name in SESSION_COLUMNS)):
+                    meter.update(session_loader.written, f", audit {audit_loader.written}")
+                if audit:
+                    for entry in history:
+                        audit_loader.add(entry)
+                summary.sessions += 1
+                session_id += 1
+        day += timedelta(days=1)
+        summary.days += 1
+    session_loader.flush()
+    audit_loader.flush()
+    meter.update(session_loader.written, f", audit {audit_loader.written}")
+    meter.finish()
+    summary.audit_entries = audit_loader.written
+
+    if db.get_bind().dialect.name == "postgresql":
+        # Explicit ids bypass the sequence; move it past them.
+        db.execute(text("SELECT setval(pg_get_serial_sequence('sessions', 'id'), (SELECT max(id) FROM sessions))"))
+        db.commit()
+    rebuild_stats(db)
+    return summary
+
+
+def _count(minimum: int):
+    def parse(value: str) -> int:
+        number = int(value)
+        if number < minimum:
+            raise argparse.ArgumentTypeError(f"must be >= {minimum}")
+        return number
+
+    return parse
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic multi-location booking history")
+    parser.add_argument("--locations", type=_count(1), default=3)
+    parser.add_argument("--resources-per-location", type=_count(1), default=4)
+    parser.add_argument("--games", type=_count(1), default=12, help="only used when there are no active games")
+    parser.add_argument("--sessions", type=_count(0), default=100000)
+    parser.add_argument("--first-day", type=date.fromisoformat, default=date(2025, 1, 1))
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--owner-email", default="synthetic-owner@example.com")
+    parser.add_argument("--password", default="synthetic")
+    parser.add_argument("--no-audit", action="store_true", help="skip audit log entries")
+    parser.add_argument("--reset", action="store_true", help="delete ALL existing data first")
+    parser.add_argument("--quiet", action="store_true", help="no progress output")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        summary = generate(
+            db,
+            locations=args.locations,
+            resources_per_location=args.resources_per_location,
+            games=args.games,
+            sessions=args.sessions,
+            first_day=args.first_day,
+            seed=args.seed,
+            owner_email=args.owner_email.strip().lower(),
+            password=args.password,
+            audit=not args.no_audit,
+            reset=args.reset,
+            progress=not args.quiet,
+        )
+    print(
+        f"Generated {summary.sessions} sessions and {summary.audit_entries} audit entries "
+        f"for {summary.first_day}..{summary.last_day} in {time.perf_counter() - started:.1f}s"
+    )
+
+
+if __name__ == "__main__":
+    main()
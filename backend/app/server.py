@@ -0,0 +1,140 @@
+from __future__ import annotations
+
+import os
+
+from gunicorn.app.base import BaseApplication
+from sqlalchemy import create_engine, text
+from sqlalchemy.pool import NullPool
+from uvicorn_worker import UvicornWorker
+
+from app.core.config import settings
+
+# Time left after draining for the lifespan shutdown (audit flush, listener stop).
+SHUTDOWN_MARGIN_SECONDS = 10
+
+
+class Worker(UvicornWorker):
+    # In-flight requests get SERVER_DRAIN_SECONDS to finish; whatever is still
+    # open after that (calendar streams) is cancelled so the lifespan shutdown
+    # runs before gunicorn's graceful timeout kills the worker.
+    CONFIG_KWARGS = {**UvicornWorker.CONFIG_KWARGS, "timeout_graceful_shutdown": settings.SERVER_DRAIN_SECONDS}
+
+
+def cpu_count() -> int:
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:
+        return os.cpu_count() or 1
+
+
+def worker_count() -> int:
+    return settings.SERVER_WORKERS or cpu_count()
+
+
+def max_connections() -> int | None:
+    if settings.DB_MAX_CONNECTIONS:
+        return settings.DB_MAX_CONNECTIONS
+    if settings.DATABASE_URL.startswith("sqlite"):
+        return None
+    engine = create_engine(settings.DATABASE_URL, poolclass=NullPool)
+    try:
+        with engine.connect() as conn:
+            return int(conn.execute(text("SHOW max_connections")).scalar_one())
+    finally:
+        engine.dispose()
+
+
+def pool_limits(workers: int, limit: int) -> tuple[int, int]:
+    # Each worker holds a sync pool, an async pool when enabled and one LISTEN
+    # connection on PostgreSQL; pool_size + max_overflow is the pool's peak.
+    budget = (limit - settings.DB_RESERVED_CONNECTIONS) // workers
+    if settings.CALENDAR_NOTIFY_ENABLED or settings.DATABASE_URL.startswith("postgresql"):
+        budget -= 1
+    per_pool = budget // (2 if settings.ASYNC_DB_ENABLED else 1)
+    if per_pool < 1:
+        raise SystemExit(
+            f"{workers} workers do not fit into max_connections={limit} "
+            f"with {settings.DB_RESERVED_CONNECTIONS} reserved; lower SERVER_WORKERS"
+        )
+    pool_size = min(settings.DB_POOL_SIZE, per_pool)
+    return pool_size, min(settings.DB_MAX_OVERFLOW, per_pool - pool_size)
+
+
+def check_process_local_state(workers: int) -> None:
+    # These caches only see writes made by their own worker.
+    if workers < 2:
+        return
+    if settings.OVERLAP_INDEX_ENABLED:
+        raise SystemExit(
+            f"OVERLAP_INDEX_ENABLED is not invalidated across workers; "
+            f"set SERVER_WORKERS=1 or disable it ({workers} workers requested)"
+        )
+    if settings.CALENDAR_SNAPSHOT_ENABLED and not settings.CALENDAR_NOTIFY_ENABLED:
+        raise SystemExit(
+            f"CALENDAR_SNAPSHOT_ENABLED with {workers} workers needs CALENDAR_NOTIFY_ENABLED; "
+            "set SERVER_WORKERS=1 or enable notify"
+        )
+
+
+def _post_fork(server, worker) -> None:
+    # The app is imported in the master; drop any pooled connections it holds
+    # so workers never share a socket with their parent.
+    from app.db import session as db_session
+    from app.db.replicas import read_replicas
+
+    engines = [db_session.engine, db_session.async_engine]
+    for replica in read_replicas.replicas:
+        engines += [replica.engine, replica.async_engine]
+    for engine in engines:
+        if engine is not None:
+            getattr(engine, "sync_engine", engine).dispose(close=False)
+
+
+class Server(BaseApplication):
+    def __init__(self, options: dict) -> None:
+        self.options = options
+        super().__init__()
+
+    def load_config(self) -> None:
+        for key, value in self.options.items():
+            self.cfg.set(key, value)
+
+    def load(self):
+        from app.main import app
+
+        return app
+
+
+def options(workers: int) -> dict:
+    return {
+        "bind": f"{settings.SERVER_HOST}:{settings.SERVER_PORT}",
+        "workers": workers,
+        "worker_class": Worker,
+        "preload_app": True,
+        "max_requests": settings.SERVER_MAX_REQUESTS,
+        "max_requests_jitter": settings.SERVER_MAX_REQUESTS_JITTER,
+        "graceful_timeout": settings.SERVER_DRAIN_SECONDS + SHUTDOWN_MARGIN_SECONDS,
+        "timeout": settings.SERVER_TIMEOUT_SECONDS,
+        "keepalive": settings.SERVER_KEEPALIVE_SECONDS,
+        "post_fork": _post_fork,
+        "proc_name": settings.PROJECT_NAME,
+    }
+
+
+def main() -> None:
+    workers = worker_count()
+    check_process_local_state(workers)
+    limit = max_connections()
+    if limit is not None:
+        # Must run before app.main is imported: the engines read these once.
+        settings.DB_POOL_SIZE, settings.DB_MAX_OVERFLOW = pool_limits(workers, limit)
+    print(
+        f"{workers} workers, db pool {settings.DB_POOL_SIZE}+{settings.DB_MAX_OVERFLOW} per worker"
+        + (f" (max_connections={limit})" if limit is not None else ""),
+        flush=True,
+    )
+    Server(options(workers)).run()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,7 +1,34 @@
+from __future__ import annotations
+
+import atexit
+import json
+import logging
+import threading
+from collections import deque
+from datetime import datetime, timezone
+
+from sqlalchemy import event, insert
 from sqlalchemy.orm import Session
 
+from app.core.config import settings
+from app.db import session as db_session
 from app.models.audit_log import AuditLog
 
+logger = logging.getLogger(__name__)
+
+PENDING_KEY = "pending_audit"
+COPY_COLUMNS = ("user_id", "entity_type", "entity_id", "action", "changes", "created_at")
+
+
+def audit_entry(user_id: int, entity_type: str, entity_id: int, action: str, changes: dict) -> dict:
+    return {
+        "user_id": user_id,
+        "entity_type": entity_type,
+        "entity_id": entity_id,
+        "action": action,
+        "changes": changes or {},
+    }
+
 
 def log_action(
     db: Session,
@@ -11,11 +38,123 @@ def log_action(
     action: str,
     changes: dict,
 ) -> None:
-    audit = AuditLog(
-        user_id=user_id,
-        entity_type=entity_type,
-        entity_id=entity_id,
-        action=action,
-        changes=changes or {},
-    )
-    db.add(audit)
+    log_actions(db, [audit_entry(user_id, entity_type, entity_id, action, changes)])
+
+
+def log_actions(db: Session, entries: list[dict]) -> None:
+    # With the sink enabled, entries wait on the session and are handed to the
+    # sink only once the transaction commits. Durable actions are still written
+    # inside the transaction, so they cannot be lost after a commit.
+    inline = entries
+    if settings.AUDIT_SINK_ENABLED:
+        durable = settings.audit_durable_actions()
+        inline = [entry for entry in entries if entry["action"] in durable]
+        now = datetime.now(timezone.utc)
+        deferred = [{**entry, "created_at": now} for entry in entries if entry["action"] not in durable]
+        if deferred:
+            db.info.setdefault(PENDING_KEY, []).extend(deferred)
+
+    if len(inline) == 1:
+        db.add(AuditLog(**inline[0]))
+    elif inline:
+        db.execute(insert(AuditLog), inline)
+
+
+@event.listens_for(Session, "after_commit")
+def _submit_pending(session: Session) -> None:
+    entries = session.info.pop(PENDING_KEY, None)
+    if entries:
+        audit_sink.submit(entries)
+
+
+@event.listens_for(Session, "after_transaction_end")
+def _discard_pending(session: Session, transaction) -> None:
+    # Runs after after_commit, so anything left here belongs to a rollback.
+    if transaction.parent is None:
+        session.info.pop(PENDING_KEY, None)
+
+
+class AuditSink:
+    def __init__(self) -> None:
+        self._pending: deque[dict] = deque()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = False
+        self._thread: threading.Thread | None = None
+
+    def depth(self) -> int:
+        return len(self._pending)
+
+    def submit(self, entries: list[dict]) -> None:
+        with self._lock:
+            overflow = len(self._pending) + len(entries) - settings.AUDIT_MAX_PENDING
+            if overflow > 0:
+                for _ in range(min(overflow, len(self._pending))):
+                    self._pending.popleft()
+                logger.error("audit sink is full, dropped %d oldest entries", overflow)
+            self._pending.extend(entries)
+            if self._thread is None:
+                self._start()
+            if len(self._pending) >= settings.AUDIT_BATCH_SIZE:
+                self._wake.set()
+
+    def _start(self) -> None:
+        self._stopping = False
+        self._thread = threading.Thread(target=self._run, name="audit-sink", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stopping:
+            self._wake.wait(settings.AUDIT_FLUSH_INTERVAL_SECONDS)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self) -> int:
+        written = 0
+        with self._flush_lock:
+            while True:
+                with self._lock:
+                    size = min(settings.AUDIT_BATCH_SIZE, len(self._pending))
+                    batch = [self._pending.popleft() for _ in range(size)]
+                if not batch:
+                    return written
+                try:
+                    self._write(batch)
+                except Exception:
+                    logger.exception("audit sink write failed, retrying %d entries later", len(batch))
+                    with self._lock:
+                        self._pending.extendleft(reversed(batch))
+                    return written
+                written += len(batch)
+
+    def _write(self, batch: list[dict]) -> None:
+        with db_session.SessionLocal() as db:
+            if db.get_bind().dialect.name == "postgresql":
+                _copy(db, batch)
+            else:
+                db.execute(insert(AuditLog), batch)
+            db.commit()
+
+    def stop(self) -> None:
+        thread = self._thread
+        if thread is not None:
+            self._stopping = True
+            self._wake.set()
+            thread.join(timeout=10)
+            self._thread = None
+        self.flush()
+
+
+def _copy(db: Session, batch: list[dict]) -> None:
+    driver_connection = db.connection().connection.driver_connection
+    with driver_connection.cursor() as cursor:
+        with cursor.copy(f"COPY {AuditLog.__tablename__} ({', '.join(COPY_COLUMNS)}) FROM STDIN") as copy:
+            for entry in batch:
+                copy.write_row(
+                    [json.dumps(entry[name], default=str) if name == "changes" else entry[name] for name in COPY_COLUMNS]
+                )
+
+
+audit_sink = AuditSink()
+atexit.register(audit_sink.stop)
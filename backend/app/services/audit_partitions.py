@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import re
+from datetime import date
+
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+
+PARENT = "audit_logs"
+PARTITION_NAME = re.compile(rf"^{PARENT}_p(\d{{4}})(\d{{2}})$")
+
+
+def add_months(month: date, months: int) -> date:
+    index = month.year * 12 + month.month - 1 + months
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(month: date) -> str:
+    return f"{PARENT}_p{month:%Y%m}"
+
+
+def attached_partitions(db: Session) -> dict[str, date]:
+    rows = db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class child ON child.oid = pg_inherits.inhrelid "
+            "WHERE pg_inherits.inhparent = CAST(:parent AS regclass)"
+        ),
+        {"parent": PARENT},
+    ).scalars()
+    partitions = {}
+    for name in rows:
+        match = PARTITION_NAME.match(name)
+        if match:
+            partitions[name] = date(int(match.group(1)), int(match.group(2)), 1)
+    return partitions
+
+
+def ensure_partitions(db: Session, today: date, months_ahead: int) -> list[str]:
+    # Future months must exist before rows arrive for them: once the default
+    # partition holds rows of a month, that month's partition cannot be created.
+    existing = attached_partitions(db)
+    created = []
+    month = today.replace(day=1)
+    for _ in range(months_ahead + 1):
+        name = partition_name(month)
+        if name not in existing:
+            upper = add_months(month, 1)
+            db.execute(
+                text(
+                    f"CREATE TABLE {name} PARTITION OF {PARENT} "
+                    f"FOR VALUES FROM ('{month.isoformat()} 00:00:00+00') TO ('{upper.isoformat()} 00:00:00+00')"
+                )
+            )
+            created.append(name)
+        month = add_months(month, 1)
+    db.commit()
+    return created
+
+
+def detach_partitions(db: Session, today: date, retain_months: int, drop: bool = False) -> list[str]:
+    # Detached tables keep their rows for archiving; drop removes them for good.
+    cutoff = add_months(today.replace(day=1), -retain_months)
+    detached = []
+    for name, month in sorted(attached_partitions(db).items(), key=lambda item: item[1]):
+        if month >= cutoff:
+            continue
+        db.execute(text(f"ALTER TABLE {PARENT} DETACH PARTITION {name}"))
+        if drop:
+            db.execute(text(f"DROP TABLE {name}"))
+        detached.append(name)
+    db.commit()
+    return detached
@@ -0,0 +1,80 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.models.enums import SessionStatus
+from app.models.session import Session as SessionModel
+from app.services.interval_index import overlap_index
+
+Interval = tuple[datetime, datetime]
+
+
+def align_up(moment: datetime, origin: datetime, step: timedelta | None) -> datetime:
+    if not step:
+        return moment
+    offset = (moment - origin) % step
+    return moment if not offset else moment + (step - offset)
+
+
+def free_gaps(
+    busy: list[Interval],
+    window_start: datetime,
+    window_end: datetime,
+    duration: timedelta,
+    step: timedelta | None = None,
+) -> list[Interval]:
+    # busy must be sorted by start; one pass collects every gap that fits.
+    gaps: list[Interval] = []
+    cursor = window_start
+    for busy_start, busy_end in [*busy, (window_end, window_end)]:
+        gap_start = align_up(cursor, window_start, step)
+        gap_end = min(busy_start, window_end)
+        if gap_end - gap_start >= duration:
+            gaps.append((gap_start, gap_end))
+        cursor = max(cursor, busy_end)
+    return gaps
+
+
+def load_busy(
+    db: Session, resource_ids: list[int], window_start: datetime, window_end: datetime
+) -> dict[int, list[Interval]]:
+    if settings.OVERLAP_INDEX_ENABLED:
+        return {
+            resource_id: overlap_index.busy(db, resource_id, window_start, window_end)
+            for resource_id in resource_ids
+        }
+
+    rows = db.execute(
+        select(SessionModel.resource_id, SessionModel.start_at, SessionModel.end_at)
+        .where(
+            SessionModel.resource_id.in_(resource_ids),
+            SessionModel.status != SessionStatus.canceled,
+            SessionModel.start_at < window_end,
+            SessionModel.end_at > window_start,
+        )
+        .order_by(SessionModel.resource_id.asc(), SessionModel.start_at.asc())
+    ).all()
+    busy: dict[int, list[Interval]] = defaultdict(list)
+    for resource_id, start_at, end_at in rows:
+        busy[resource_id].append((start_at, end_at))
+    return busy
+
+
+def find_free_slots(
+    db: Session,
+    resource_ids: list[int],
+    window_start: datetime,
+    window_end: datetime,
+    duration: timedelta,
+    step: timedelta | None = None,
+) -> dict[int, list[Interval]]:
+    busy = load_busy(db, resource_ids, window_start, window_end)
+    return {
+        resource_id: free_gaps(busy.get(resource_id, []), window_start, window_end, duration, step)
+        for resource_id in resource_ids
+    }
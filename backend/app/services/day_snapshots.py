@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Hashable
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import date
+from threading import Lock
+
+from app.core.config import settings
+from app.services.events import broker
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class DaySnapshot:
+    etag: str
+    body: bytes
+
+
+class _Entry:
+    __slots__ = ("snapshot", "fresh_until", "version", "refresh")
+
+    def __init__(self) -> None:
+        self.snapshot: DaySnapshot | None = None
+        self.fresh_until = 0.0
+        # Bumped by every invalidation, so a build that raced a write is
+        # stored as already stale instead of fresh.
+        self.version = 0
+        self.refresh: Future | None = None
+
+
+# Serialized /calendar/day bodies keyed by (location_id, day, catalog version).
+# Owners see every location under location_id None. One build per key runs at
+# a time on a small pool and concurrent readers share it; with
+# stale-while-revalidate a reader waits only briefly before falling back to
+# the previous snapshot.
+class DaySnapshotCache:
+    def __init__(self, maxsize: int, ttl: float, stale_wait: float | None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.stale_wait = stale_wait
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._lock = Lock()
+        self._executor: ThreadPoolExecutor | None = None
+
+    def size(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: Hashable, build: Callable[[], DaySnapshot]) -> tuple[Future, DaySnapshot | None]:
+        # Returns the fresh snapshot as a finished future, or the running
+        # build together with the stale snapshot it replaces, if any.
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                entry = self._entries[key] = _Entry()
+                while len(self._entries) > self.maxsize:
+                    self._entries.popitem(last=False)
+            self._entries.move_to_end(key)
+            if entry.snapshot is not None and entry.fresh_until > time.monotonic():
+                done: Future = Future()
+                done.set_result(entry.snapshot)
+                return done, None
+            if entry.refresh is None:
+                entry.refresh = self._pool().submit(self._build, key, entry, entry.version, build)
+            return entry.refresh, entry.snapshot
+
+    def fetch(self, key: Hashable, build: Callable[[], DaySnapshot]) -> tuple[DaySnapshot, bool]:
+        future, stale = self.get(key, build)
+        if stale is None or self.stale_wait is None:
+            return future.result(), False
+        try:
+            return future.result(timeout=self.stale_wait), False
+        except Exception as exc:
+            self._log_fallback(exc)
+            return stale, True
+
+    async def fetch_async(self, key: Hashable, build: Callable[[], DaySnapshot]) -> tuple[DaySnapshot, bool]:
+        future, stale = self.get(key, build)
+        result = asyncio.wrap_future(future)
+        if stale is None or self.stale_wait is None:
+            return await result, False
+        try:
+            # Shielded: a reader giving up must not cancel the shared build.
+            return await asyncio.wait_for(asyncio.shield(result), self.stale_wait), False
+        except Exception as exc:
+            self._log_fallback(exc)
+            return stale, True
+
+    @staticmethod
+    def _log_fallback(exc: Exception) -> None:
+        if not isinstance(exc, TimeoutError):
+            logger.error("day snapshot refresh failed, serving the stale one: %r", exc)
+
+    def _build(self, key: Hashable, entry: _Entry, version: int, build: Callable[[], DaySnapshot]) -> DaySnapshot:
+        try:
+            snapshot = build()
+        except Exception:
+            with self._lock:
+                entry.refresh = None
+            raise
+        with self._lock:
+            entry.snapshot = snapshot
+            entry.fresh_until = time.monotonic() + self.ttl if entry.version == version else 0.0
+            entry.refresh = None
+        return snapshot
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=settings.CALENDAR_SNAPSHOT_WORKERS, thread_name_prefix="day-snapshot"
+            )
+        return self._executor
+
+    def invalidate(self, location_ids: list[int], days: list[date]) -> None:
+        with self._lock:
+            targets = {(location_id, day) for location_id in [*location_ids, None] for day in days}
+            for key, entry in self._entries.items():
+                if key[:2] in targets:
+                    entry.version += 1
+                    entry.fresh_until = 0.0
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def on_event(self, event: dict) -> None:
+        self.invalidate(event["location_ids"], [date.fromisoformat(day) for day in event["dates"]])
+
+
+day_snapshots = DaySnapshotCache(
+    maxsize=settings.CALENDAR_SNAPSHOT_SIZE,
+    ttl=settings.CALENDAR_SNAPSHOT_TTL_SECONDS,
+    stale_wait=settings.CALENDAR_SNAPSHOT_STALE_WAIT_SECONDS if settings.CALENDAR_SNAPSHOT_STALE_WHILE_REVALIDATE else None,
+)
+if settings.CALENDAR_SNAPSHOT_ENABLED:
+    broker.add_handler(day_snapshots.on_event)
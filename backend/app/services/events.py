@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import date
+
+from sqlalchemy import String, func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.core.principals import PRINCIPALS_CHANNEL, principal_cache
+from app.models.session import Session as SessionModel
+from app.services.session_out import session_to_out
+
+logger = logging.getLogger(__name__)
+
+CHANNEL = "calendar_events"
+# PostgreSQL rejects NOTIFY payloads of 8000 bytes or more.
+MAX_NOTIFY_BYTES = 7900
+SUBSCRIBER_QUEUE_SIZE = 256
+
+
+def session_event(action: str, session: SessionModel, previous: tuple[int, date] | None = None) -> dict:
+    location_ids = {session.location_id}
+    dates = {session.start_at.date().isoformat()}
+    if previous is not None:
+        location_ids.add(previous[0])
+        dates.add(previous[1].isoformat())
+    return {
+        "action": action,
+        "session_id": session.id,
+        "location_ids": sorted(location_ids),
+        "dates": sorted(dates),
+        "session": session_to_out(session).model_dump(mode="json"),
+    }
+
+
+def deleted_event(session_id: int, location_id: int, day: date) -> dict:
+    return {
+        "action": "delete",
+        "session_id": session_id,
+        "location_ids": [location_id],
+        "dates": [day.isoformat()],
+        "session": None,
+    }
+
+
+@dataclass(eq=False)
+class Subscription:
+    location_id: int | None
+    day: str
+    queue: asyncio.Queue = field(default_factory=lambda: asyncio.Queue(SUBSCRIBER_QUEUE_SIZE))
+    overflowed: bool = False
+
+    def wants(self, event: dict) -> bool:
+        if self.day not in event["dates"]:
+            return False
+        return self.location_id is None or self.location_id in event["location_ids"]
+
+
+class CalendarBroker:
+    def __init__(self) -> None:
+        self._subscribers: set[Subscription] = set()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._listener: asyncio.Task | None = None
+        self._handlers: list[Callable[[dict], None]] = []
+
+    def add_handler(self, handler: Callable[[dict], None]) -> None:
+        # Handlers see every event synchronously, subscribers or not.
+        self._handlers.append(handler)
+
+    def run_handlers(self, event: dict) -> None:
+        for handler in self._handlers:
+            try:
+                handler(event)
+            except Exception:
+                logger.exception("calendar event handler failed")
+
+    def subscribe(self, location_id: int | None, day: date) -> Subscription:
+        subscription = Subscription(location_id=location_id, day=day.isoformat())
+        self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        self._subscribers.discard(subscription)
+
+    def dispatch(self, event: dict) -> None:
+        # Called from request threads, greenlets and the listener task alike.
+        self.run_handlers(event)
+        if self._loop is None or not self._subscribers:
+            return
+        self._loop.call_soon_threadsafe(self._fan_out, event)
+
+    def _fan_out(self, event: dict) -> None:
+        for subscription in list(self._subscribers):
+            if not subscription.wants(event):
+                continue
+            try:
+                subscription.queue.put_nowait(event)
+            except asyncio.QueueFull:
+                subscription.overflowed = True
+
+    async def start(self) -> None:
+        self._loop = asyncio.get_running_loop()
+        # Principal changes are always listened for on PostgreSQL, calendar
+        # events only with CALENDAR_NOTIFY_ENABLED.
+        if settings.CALENDAR_NOTIFY_ENABLED or settings.DATABASE_URL.startswith("postgresql"):
+            self._listener = asyncio.create_task(self._listen())
+
+    async def stop(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._loop = None
+
+    async def _listen(self) -> None:
+        import psycopg
+
+        conninfo = make_url(settings.DATABASE_URL).set(drivername="postgresql").render_as_string(hide_password=False)
+        while True:
+            try:
+                async with await psycopg.AsyncConnection.connect(conninfo, autocommit=True) as conn:
+                    await conn.execute(f"LISTEN {PRINCIPALS_CHANNEL}")
+                    if settings.CALENDAR_NOTIFY_ENABLED:
+                        await conn.execute(f"LISTEN {CHANNEL}")
+                    # Changes made while disconnected were not heard.
+                    principal_cache.clear()
+                    async for notify in conn.notifies():
+                        if notify.channel == PRINCIPALS_CHANNEL:
+                            principal_cache.clear()
+                        else:
+                            self.dispatch(json.loads(notify.payload))
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("calendar listener failed, reconnecting")
+                await asyncio.sleep(1)
+
+
+broker = CalendarBroker()
+
+
+def _commit_lsn(db: Session) -> str | None:
+    # The primary's WAL position once the write has committed; readers echo it
+    # back as X-Min-LSN so only replicas that replayed the write serve them.
+    if not settings.replica_urls() or db.get_bind().dialect.name != "postgresql":
+        return None
+    try:
+        with db.get_bind().connect() as conn:
+            return conn.execute(select(func.pg_current_wal_lsn().cast(String))).scalar_one()
+    except Exception:
+        logger.exception("failed to read the commit LSN")
+        return None
+
+
+def publish_session_events(db: Session, events: list[dict]) -> None:
+    if not events:
+        return
+    lsn = _commit_lsn(db)
+    events = [{**event, "lsn": lsn} for event in events]
+    if not settings.CALENDAR_NOTIFY_ENABLED:
+        for event in events:
+            broker.dispatch(event)
+        return
+
+    # Every worker, this one included, receives the event back through LISTEN.
+    # Local handlers run now as well, so this worker's caches reflect the write
+    # before the response goes out. A separate connection keeps the caller's
+    # freshly loaded objects unexpired.
+    for event in events:
+        broker.run_handlers(event)
+    try:
+        with db.get_bind().begin() as conn:
+            for event in events:
+                payload = json.dumps(event)
+                if len(payload.encode()) > MAX_NOTIFY_BYTES:
+                    payload = json.dumps({**event, "session": None})
+                conn.execute(select(func.pg_notify(CHANNEL, payload)))
+    except Exception:
+        logger.exception("failed to publish calendar events")
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import csv
+import io
+import json
+from collections.abc import Iterable, Iterator
+from dataclasses import dataclass
+from datetime import datetime
+from enum import Enum
+
+from sqlalchemy import Select, select
+from sqlalchemy.orm import Session
+
+from app.db import session as db_session
+from app.models.audit_log import AuditLog
+from app.models.game import Game
+from app.models.location import Location
+from app.models.resource import Resource
+from app.models.session import Session as SessionModel
+from app.models.user import User
+
+EXPORT_CHUNK_ROWS = 5000
+# Excel only detects UTF-8 in a CSV file by its byte order mark.
+CSV_BOM = "\ufeff"
+
+
+@dataclass(frozen=True)
+class ExportColumn:
+    name: str
+    expression: object
+    # int, str, enum, json, datetime (naive) or timestamptz
+    kind: str
+
+
+SESSION_COLUMNS = (
+    ExportColumn("id", SessionModel.id, "int"),
+    ExportColumn("location_id", SessionModel.location_id, "int"),
+    ExportColumn("location_name", Location.name, "str"),
+    ExportColumn("resource_id", SessionModel.resource_id, "int"),
+    ExportColumn("resource_name", Resource.name, "str"),
+    ExportColumn("game_id", SessionModel.game_id, "int"),
+    ExportColumn("game_name", Game.name, "str"),
+    ExportColumn("start_at", SessionModel.start_at, "datetime"),
+    ExportColumn("end_at", SessionModel.end_at, "datetime"),
+    ExportColumn("duration_min", SessionModel.duration_min, "int"),
+    ExportColumn("status", SessionModel.status, "enum"),
+    ExportColumn("players", SessionModel.players, "int"),
+    ExportColumn("contact_name", SessionModel.contact_name, "str"),
+    ExportColumn("contact_phone", SessionModel.contact_phone, "str"),
+    ExportColumn("comment", SessionModel.comment, "str"),
+    ExportColumn("canceled_reason", SessionModel.canceled_reason, "str"),
+    ExportColumn("canceled_at", SessionModel.canceled_at, "datetime"),
+    ExportColumn("completed_at", SessionModel.completed_at, "datetime"),
+    ExportColumn("created_by_id", SessionModel.created_by_id, "int"),
+    ExportColumn("created_at", SessionModel.created_at, "timestamptz"),
+    ExportColumn("updated_at", SessionModel.updated_at, "timestamptz"),
+)
+
+AUDIT_COLUMNS = (
+    ExportColumn("id", AuditLog.id, "int"),
+    ExportColumn("created_at", AuditLog.created_at, "timestamptz"),
+    ExportColumn("user_id", AuditLog.user_id, "int"),
+    ExportColumn("user_email", User.email, "str"),
+    ExportColumn("entity_type", AuditLog.entity_type, "str"),
+    ExportColumn("entity_id", AuditLog.entity_id, "int"),
+    ExportColumn("action", AuditLog.action, "str"),
+    ExportColumn("changes", AuditLog.changes, "json"),
+)
+
+
+def sessions_export_select(start: datetime, end: datetime, location_id: int | None = None) -> Select:
+    query = (
+        select(*(column.expression for column in SESSION_COLUMNS))
+        .select_from(SessionModel)
+        .outerjoin(Location, Location.id == SessionModel.location_id)
+        .outerjoin(Resource, Resource.id == SessionModel.resource_id)
+        .outerjoin(Game, Game.id == SessionModel.game_id)
+        .where(SessionModel.start_at >= start, SessionModel.start_at < end)
+    )
+    if location_id is not None:
+        query = query.where(SessionModel.location_id == location_id)
+    return query.order_by(SessionModel.start_at.asc(), SessionModel.id.asc())
+
+
+def audit_export_select(start: datetime, end: datetime) -> Select:
+    return (
+        select(*(column.expression for column in AUDIT_COLUMNS))
+        .select_from(AuditLog)
+        .outerjoin(User, User.id == AuditLog.user_id)
+        .where(AuditLog.created_at >= start, AuditLog.created_at < end)
+        .order_by(AuditLog.created_at.asc(), AuditLog.id.asc())
+    )
+
+
+def _plain(value, kind: str):
+    if value is None:
+        return None
+    if isinstance(value, Enum):
+        return value.value
+    if kind == "json":
+        return json.dumps(value, ensure_ascii=False, default=str)
+    return value
+
+
+def _csv_cell(value, kind: str):
+    value = _plain(value, kind)
+    if value is None:
+        return ""
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+def iter_csv(partitions: Iterable[list], columns: tuple[ExportColumn, ...]) -> Iterator[str]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow([column.name for column in columns])
+    yield CSV_BOM + buffer.getvalue()
+    for rows in partitions:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerows([_csv_cell(value, column.kind) for value, column in zip(row, columns)] for row in rows)
+        yield buffer.getvalue()
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _ChunkSink(io.RawIOBase):
+    # Collects what the Parquet writer emits so each row group can be handed
+    # to the response as soon as it is written.
+    def __init__(self) -> None:
+        self._chunks: list[bytes] = []
+        self._position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        data = bytes(data)
+        self._chunks.append(data)
+        self._position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_parquet(partitions: Iterable[list], columns: tuple[ExportColumn, ...]) -> Iterator[bytes]:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    types = {
+        "int": pa.int64(),
+        "str": pa.string(),
+        "enum": pa.string(),
+        "json": pa.string(),
+        "datetime": pa.timestamp("us"),
+        "timestamptz": pa.timestamp("us", tz="UTC"),
+    }
+    schema = pa.schema([(column.name, types[column.kind]) for column in columns])
+    sink = _ChunkSink()
+    writer = pq.ParquetWriter(sink, schema)
+    try:
+        for rows in partitions:
+            arrays = [
+                pa.array([_plain(row[index], column.kind) for row in rows], type=types[column.kind])
+                for index, column in enumerate(columns)
+            ]
+            # One row group per partition keeps memory bounded by EXPORT_CHUNK_ROWS.
+            writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=schema))
+            chunk = sink.drain()
+            if chunk:
+                yield chunk
+    finally:
+        writer.close()
+    yield sink.drain()
+
+
+def iter_export(statement: Select, columns: tuple[ExportColumn, ...], fmt: str) -> Iterator[str | bytes]:
+    # Owns its session: a streamed response outlives the request-scoped one.
+    with db_session.SessionLocal() as db:
+        yield from export_rows(db, statement, columns, fmt)
+
+
+def export_rows(db: Session, statement: Select, columns: tuple[ExportColumn, ...], fmt: str) -> Iterator[str | bytes]:
+    # stream_results makes psycopg use a server-side cursor, so only one
+    # partition of rows is held in memory at a time.
+    result = db.execute(statement.execution_options(stream_results=True, yield_per=EXPORT_CHUNK_ROWS))
+    partitions = result.partitions()
+    if fmt == "parquet":
+        yield from iter_parquet(partitions, columns)
+    else:
+        yield from iter_csv(partitions, columns)
@@ -0,0 +1,155 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from threading import Lock
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+from app.db import session as db_session
+from app.models.game import Game
+from app.schemas.game import GameOut
+from app.services.versions import games_version
+
+logger = logging.getLogger(__name__)
+
+# Without a session, an unknown game id re-checks the catalog at most this
+# often; the last check per id is remembered for MISS_CHECK_SIZE ids.
+MISS_CHECK_SECONDS = 1.0
+MISS_CHECK_SIZE = 1024
+
+
+@dataclass(frozen=True)
+class CatalogSnapshot:
+    version: tuple = ()
+    games: dict[int, GameOut] = field(default_factory=dict)
+    by_name: tuple[GameOut, ...] = ()
+
+
+# Readers take the current snapshot without locking; a reload builds a new one
+# and swaps it in. Writes in this process reload right after commit, other
+# workers notice the changed games_version() on their next periodic check.
+class GamesCatalog:
+    def __init__(self) -> None:
+        self._snapshot: CatalogSnapshot | None = None
+        self._reload_lock = Lock()
+        self._refresher: asyncio.Task | None = None
+        self._background: asyncio.Task | None = None
+        self._miss_lock = Lock()
+        self._miss_checked_at: OrderedDict[int, float] = OrderedDict()
+
+    @property
+    def version(self) -> tuple:
+        return self._current().version
+
+    def load(self, db: Session | None = None) -> CatalogSnapshot:
+        with self._reload_lock:
+            if db is None:
+                with db_session.SessionLocal() as own:
+                    self._snapshot = self._read(own)
+            else:
+                self._snapshot = self._read(db)
+            return self._snapshot
+
+    def _read(self, db: Session) -> CatalogSnapshot:
+        version = tuple(db.execute(games_version()).one())
+        games = [GameOut.model_validate(game) for game in db.scalars(select(Game).order_by(Game.name.asc()))]
+        return CatalogSnapshot(version=version, games={game.id: game for game in games}, by_name=tuple(games))
+
+    def _current(self, db: Session | None = None) -> CatalogSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        if db is None and self._in_background(self.load):
+            return CatalogSnapshot()
+        return self.load(db)
+
+    def get(self, game_id: int, db: Session | None = None) -> GameOut | None:
+        game = self._current(db).games.get(game_id)
+        if game is not None:
+            return game
+        # Possibly created by another worker or connection since the last check.
+        if db is not None:
+            # A primary key lookup; only a game that really exists reloads.
+            if db.get(Game, game_id) is None:
+                return None
+            return self.load(db).games.get(game_id)
+        if not self._miss_due(game_id) or self._in_background(self.check):
+            return None
+        return self.check().games.get(game_id)
+
+    def _miss_due(self, game_id: int) -> bool:
+        now = time.monotonic()
+        with self._miss_lock:
+            checked_at = self._miss_checked_at.get(game_id)
+            if checked_at is not None and now - checked_at < MISS_CHECK_SECONDS:
+                return False
+            self._miss_checked_at[game_id] = now
+            self._miss_checked_at.move_to_end(game_id)
+            while len(self._miss_checked_at) > MISS_CHECK_SIZE:
+                self._miss_checked_at.popitem(last=False)
+            return True
+
+    def _in_background(self, func) -> bool:
+        # On the event loop (async routes) the database is not touched inline:
+        # the reload runs in a thread and this call answers from what it has.
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+        if self._background is None or self._background.done():
+            self._background = loop.create_task(self._run_in_thread(func))
+        return True
+
+    async def _run_in_thread(self, func) -> None:
+        try:
+            await asyncio.to_thread(func)
+        except Exception:
+            logger.exception("games catalog reload failed")
+
+    def active(self, game_id: int, db: Session | None = None) -> GameOut | None:
+        game = self.get(game_id, db)
+        return game if game is not None and game.is_active else None
+
+    def all(self, active_only: bool = False) -> list[GameOut]:
+        games = self._current().by_name
+        return [game for game in games if game.is_active] if active_only else list(games)
+
+    def check(self, db: Session | None = None) -> CatalogSnapshot:
+        if db is None:
+            with db_session.SessionLocal() as own:
+                return self.check(own)
+        version = tuple(db.execute(games_version()).one())
+        snapshot = self._snapshot
+        if snapshot is None or version != snapshot.version:
+            return self.load(db)
+        return snapshot
+
+    async def start(self) -> None:
+        await asyncio.to_thread(self.load)
+        self._refresher = asyncio.create_task(self._refresh())
+
+    async def stop(self) -> None:
+        if self._refresher is not None:
+            self._refresher.cancel()
+            try:
+                await self._refresher
+            except asyncio.CancelledError:
+                pass
+            self._refresher = None
+
+    async def _refresh(self) -> None:
+        while True:
+            await asyncio.sleep(settings.GAMES_CATALOG_REFRESH_SECONDS)
+            try:
+                await asyncio.to_thread(self.check)
+            except Exception:
+                logger.exception("games catalog refresh failed")
+
+
+games_catalog = GamesCatalog()
@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import datetime
+from threading import RLock
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.enums import SessionStatus
+from app.models.session import Session as SessionModel
+
+
+class ResourceIntervals:
+    """Busy intervals of one resource kept as parallel arrays sorted by start.
+
+    Bookings of a resource never overlap, so ends are sorted as well and both
+    overlap and free-slot lookups are a couple of bisections.
+    """
+
+    def __init__(self, rows: list[tuple[int, datetime, datetime]]) -> None:
+        rows = sorted(rows, key=lambda row: (row[1], row[0]))
+        self.ids = [row[0] for row in rows]
+        self.starts = [row[1] for row in rows]
+        self.ends = [row[2] for row in rows]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def add(self, session_id: int, start_at: datetime, end_at: datetime) -> None:
+        index = bisect_right(self.starts, start_at)
+        self.ids.insert(index, session_id)
+        self.starts.insert(index, start_at)
+        self.ends.insert(index, end_at)
+
+    def remove(self, session_id: int, start_at: datetime) -> None:
+        index = bisect_left(self.starts, start_at)
+        while index < len(self.ids) and self.starts[index] == start_at:
+            if self.ids[index] == session_id:
+                del self.ids[index], self.starts[index], self.ends[index]
+                return
+            index += 1
+
+    def overlaps(self, start_at: datetime, end_at: datetime, ignore_session_id: int | None = None) -> bool:
+        index = bisect_left(self.starts, end_at) - 1
+        while index >= 0:
+            if self.ids[index] != ignore_session_id:
+                return self.ends[index] > start_at
+            index -= 1
+        return False
+
+    def busy(self, start_at: datetime, end_at: datetime) -> list[tuple[datetime, datetime]]:
+        first = bisect_right(self.ends, start_at)
+        last = bisect_left(self.starts, end_at)
+        return list(zip(self.starts[first:last], self.ends[first:last]))
+
+
+class OverlapIndex:
+    """Process-local interval index of non-canceled sessions, one per resource.
+
+    A resource is loaded from the database on first use, so the index rebuilds
+    itself lazily after a restart. Writes made by other processes are not seen,
+    which is why the index is opt-in (OVERLAP_INDEX_ENABLED) and meant for
+    single-worker deployments.
+    """
+
+    def __init__(self) -> None:
+        self._lock = RLock()
+        self._resources: dict[int, ResourceIntervals] = {}
+        self._locations: dict[int, tuple[int, datetime]] = {}
+
+    def _load(self, db: Session, resource_id: int) -> ResourceIntervals:
+        intervals = self._resources.get(resource_id)
+        if intervals is not None:
+            return intervals
+        rows = db.execute(
+            select(SessionModel.id, SessionModel.start_at, SessionModel.end_at).where(
+                SessionModel.resource_id == resource_id,
+                SessionModel.status != SessionStatus.canceled,
+            )
+        ).all()
+        intervals = ResourceIntervals([tuple(row) for row in rows])
+        for session_id, start_at, _ in rows:
+            self._locations[session_id] = (resource_id, start_at)
+        self._resources[resource_id] = intervals
+        return intervals
+
+    def overlaps(
+        self,
+        db: Session,
+        resource_id: int,
+        start_at: datetime,
+        end_at: datetime,
+        ignore_session_id: int | None = None,
+    ) -> bool:
+        with self._lock:
+            return self._load(db, resource_id).overlaps(start_at, end_at, ignore_session_id)
+
+    def busy(
+        self, db: Session, resource_id: int, start_at: datetime, end_at: datetime
+    ) -> list[tuple[datetime, datetime]]:
+        with self._lock:
+            return self._load(db, resource_id).busy(start_at, end_at)
+
+    def record(self, session: SessionModel) -> None:
+        with self._lock:
+            self._discard(session.id)
+            if session.status == SessionStatus.canceled:
+                return
+            intervals = self._resources.get(session.resource_id)
+            if intervals is None:
+                # Not loaded yet; the next lookup reads the row from the database.
+                return
+            intervals.add(session.id, session.start_at, session.end_at)
+            self._locations[session.id] = (session.resource_id, session.start_at)
+
+    def discard(self, session_id: int) -> None:
+        with self._lock:
+            self._discard(session_id)
+
+    def _discard(self, session_id: int) -> None:
+        location = self._locations.pop(session_id, None)
+        if location is None:
+            return
+        resource_id, start_at = location
+        intervals = self._resources.get(resource_id)
+        if intervals is not None:
+            intervals.remove(session_id, start_at)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._resources.clear()
+            self._locations.clear()
+
+
+overlap_index = OverlapIndex()
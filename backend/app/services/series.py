@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+from collections.abc import Iterator
+from dataclasses import dataclass
+from datetime import date, datetime, timedelta
+
+from fastapi import HTTPException, status
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.models.enums import SeriesFrequency, SessionStatus
+from app.models.session import Session as SessionModel
+
+MAX_OCCURRENCES = 366
+
+
+@dataclass(frozen=True)
+class Conflict:
+    start_at: datetime
+    end_at: datetime
+    session_id: int
+    session_start_at: datetime
+    session_end_at: datetime
+
+
+def _bad_request(detail: str) -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
+
+
+def series_weekdays(payload) -> list[int]:
+    if payload.frequency == SeriesFrequency.daily:
+        return []
+    weekdays = sorted(set(payload.weekdays)) or [payload.start_date.isoweekday()]
+    if weekdays[0] < 1 or weekdays[-1] > 7:
+        raise _bad_request("weekdays must be ISO weekdays from 1 to 7")
+    return weekdays
+
+
+def _candidate_dates(payload, weekdays: list[int]) -> Iterator[date]:
+    if payload.frequency == SeriesFrequency.daily:
+        day = payload.start_date
+        while True:
+            yield day
+            day += timedelta(days=payload.interval)
+    week = payload.start_date - timedelta(days=payload.start_date.isoweekday() - 1)
+    while True:
+        for weekday in weekdays:
+            day = week + timedelta(days=weekday - 1)
+            if day >= payload.start_date:
+                yield day
+        week += timedelta(weeks=payload.interval)
+
+
+def expand_series(payload) -> list[tuple[datetime, datetime]]:
+    # Like RRULE, count covers the generated dates before exceptions are removed.
+    if payload.until_date is None and payload.count is None:
+        raise _bad_request("Series needs until_date or count")
+    if payload.until_date is not None and payload.until_date < payload.start_date:
+        raise _bad_request("until_date must not be before start_date")
+
+    skipped = set(payload.exceptions)
+    duration = timedelta(minutes=payload.duration_min)
+    occurrences = []
+    generated = 0
+    for day in _candidate_dates(payload, series_weekdays(payload)):
+        if payload.until_date is not None and day > payload.until_date:
+            break
+        if payload.count is not None and generated >= payload.count:
+            break
+        generated += 1
+        if generated > MAX_OCCURRENCES:
+            raise _bad_request(f"Series is limited to {MAX_OCCURRENCES} occurrences")
+        if day not in skipped:
+            start_at = datetime.combine(day, payload.start_time)
+            occurrences.append((start_at, start_at + duration))
+    if not occurrences:
+        raise _bad_request("Series has no occurrences")
+    return occurrences
+
+
+def find_conflicts(db: Session, resource_id: int, occurrences: list[tuple[datetime, datetime]]) -> list[Conflict]:
+    # One range fetch for the whole series, then a merge of two start-ordered
+    # lists. Live sessions of a resource never overlap each other, so their
+    # ends are ordered too and the cursor only moves forward.
+    rows = db.execute(
+        select(SessionModel.id, SessionModel.start_at, SessionModel.end_at)
+        .where(
+            SessionModel.resource_id == resource_id,
+            SessionModel.status != SessionStatus.canceled,
+            SessionModel.start_at < occurrences[-1][1],
+            SessionModel.end_at > occurrences[0][0],
+        )
+        .order_by(SessionModel.start_at.asc())
+    ).all()
+
+    conflicts = []
+    cursor = 0
+    for start_at, end_at in occurrences:
+        while cursor < len(rows) and rows[cursor].end_at <= start_at:
+            cursor += 1
+        position = cursor
+        while position < len(rows) and rows[position].start_at < end_at:
+            row = rows[position]
+            conflicts.append(Conflict(start_at, end_at, row.id, row.start_at, row.end_at))
+            position += 1
+    return conflicts
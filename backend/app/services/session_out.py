@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from app.models.session import Session as SessionModel
+from app.schemas.session import SessionOut
+from app.services.games_catalog import games_catalog
+
+
+# The SessionOut fields of an ORM row, for paths that serialize many rows and
+# trust the database: orjson writes these dicts directly, with no model in between.
+def session_fields(session: SessionModel) -> dict:
+    game = games_catalog.get(session.game_id)
+    return dict(
+        id=session.id,
+        location_id=session.location_id,
+        resource_id=session.resource_id,
+        resource_name=session.resource.name if session.resource else "",
+        game_id=session.game_id,
+        series_id=session.series_id,
+        game_name=game.name if game else "",
+        game_icon=game.mode_icon if game else None,
+        start_at=session.start_at,
+        end_at=session.end_at,
+        duration_min=session.duration_min,
+        status=session.status,
+        players=session.players,
+        contact_name=session.contact_name,
+        contact_phone=session.contact_phone,
+        comment=session.comment,
+        canceled_reason=session.canceled_reason,
+        created_at=session.created_at,
+        updated_at=session.updated_at,
+    )
+
+
+def session_to_out(session: SessionModel) -> SessionOut:
+    return SessionOut(**session_fields(session))
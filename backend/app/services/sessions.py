@@ -1,21 +1,70 @@
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from bisect import bisect_left
+from collections import defaultdict
+from collections.abc import Iterator
+from contextlib import contextmanager
+from datetime import date, datetime, timedelta
 
 from fastapi import HTTPException, status
-from sqlalchemy.orm import Session
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy import insert, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session, joinedload
 
+from app.core.config import settings
 from app.models.enums import SessionStatus, UserRole
-from app.models.game import Game
 from app.models.resource import Resource
 from app.models.session import Session as SessionModel
-from app.services.audit import log_action
+from app.models.session_series import SessionSeries
+from app.services.audit import audit_entry, log_action, log_actions
+from app.services.events import deleted_event, publish_session_events, session_event
+from app.services.games_catalog import games_catalog
+from app.services.interval_index import overlap_index
+from app.services.series import Conflict, expand_series, find_conflicts, series_weekdays
+from app.services.stats import StatsDelta, apply_stats
+
+OVERLAP_CONSTRAINT = "sessions_no_overlap"
+OVERLAP_DETAIL = "Time overlap for resource"
 
 
 def compute_end_at(start_at: datetime, duration_min: int) -> datetime:
     return start_at + timedelta(minutes=duration_min)
 
 
+# Game names and icons come from games_catalog, so only the resource is joined.
+SESSION_LOAD_OPTIONS = (joinedload(SessionModel.resource),)
+
+
+def session_query(db: Session):
+    return db.query(SessionModel).options(*SESSION_LOAD_OPTIONS)
+
+
+def session_select():
+    return select(SessionModel).options(*SESSION_LOAD_OPTIONS)
+
+
+def load_session(db: Session, session_id: int) -> SessionModel:
+    return session_query(db).populate_existing().filter(SessionModel.id == session_id).one()
+
+
+def _on_committed(
+    db: Session, action: str, sessions: list[SessionModel], previous: tuple[int, date] | None = None
+) -> None:
+    if settings.OVERLAP_INDEX_ENABLED:
+        for session in sessions:
+            overlap_index.record(session)
+    publish_session_events(db, [session_event(action, session, previous) for session in sessions])
+
+
+def _after_commit(
+    db: Session, session_id: int, action: str, previous: tuple[int, date] | None = None
+) -> SessionModel:
+    session = load_session(db, session_id)
+    _on_committed(db, action, [session], previous)
+    return session
+
+
 def ensure_resource_access(db: Session, user, resource_id: int) -> Resource:
     resource = db.query(Resource).filter(Resource.id == resource_id).first()
     if not resource:
@@ -26,7 +75,7 @@ def ensure_resource_access(db: Session, user, resource_id: int) -> Resource:
 
 
 def ensure_session_access(db: Session, user, session_id: int) -> SessionModel:
-    query = db.query(SessionModel).filter(SessionModel.id == session_id)
+    query = session_query(db).filter(SessionModel.id == session_id)
     if user.role != UserRole.owner:
         query = query.filter(SessionModel.location_id == user.location_id)
     session = query.first()
@@ -42,23 +91,39 @@ def check_overlap(
     end_at: datetime,
     ignore_session_id: int | None = None,
 ) -> None:
-    query = db.query(SessionModel).filter(
-        SessionModel.resource_id == resource_id,
-        SessionModel.status != SessionStatus.canceled,
-        SessionModel.start_at < end_at,
-        SessionModel.end_at > start_at,
-    )
-    if ignore_session_id:
-        query = query.filter(SessionModel.id != ignore_session_id)
-    exists = db.query(query.exists()).scalar()
+    if settings.OVERLAP_INDEX_ENABLED:
+        exists = overlap_index.overlaps(db, resource_id, start_at, end_at, ignore_session_id)
+    else:
+        query = db.query(SessionModel).filter(
+            SessionModel.resource_id == resource_id,
+            SessionModel.status != SessionStatus.canceled,
+            SessionModel.start_at < end_at,
+            SessionModel.end_at > start_at,
+        )
+        if ignore_session_id:
+            query = query.filter(SessionModel.id != ignore_session_id)
+        exists = db.query(query.exists()).scalar()
     if exists:
-        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="Time overlap for resource")
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=OVERLAP_DETAIL)
+
+
+@contextmanager
+def overlap_conflict(db: Session) -> Iterator[None]:
+    # check_overlap is the fast path; the exclusion constraint catches the race
+    # between two bookings that both passed it.
+    try:
+        yield
+    except IntegrityError as exc:
+        db.rollback()
+        diag = getattr(exc.orig, "diag", None)
+        if getattr(diag, "constraint_name", None) == OVERLAP_CONSTRAINT:
+            raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=OVERLAP_DETAIL) from exc
+        raise
 
 
 def create_session(db: Session, user, payload) -> SessionModel:
     resource = ensure_resource_access(db, user, payload.resource_id)
-    game = db.query(Game).filter(Game.id == payload.game_id, Game.is_active.is_(True)).first()
-    if not game:
+    if not games_catalog.active(payload.game_id, db):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
     end_at = compute_end_at(payload.start_at, payload.duration_min)
     check_overlap(db, resource.id, payload.start_at, end_at)
@@ -79,19 +144,23 @@ def create_session(db: Session, user, payload) -> SessionModel:
         updated_by_id=user.id,
     )
     db.add(session)
-    db.commit()
-    db.refresh(session)
-    return session
+    with overlap_conflict(db):
+        db.flush()
+        session_id = session.id
+        apply_stats(db, StatsDelta().add(session))
+        db.commit()
+    return _after_commit(db, session_id, "create")
 
 
 def update_session(db: Session, user, session_id: int, payload) -> SessionModel:
     session = ensure_session_access(db, user, session_id)
+    previous = (session.location_id, session.start_at.date())
+    stats = StatsDelta().remove(session)
 
     new_resource_id = payload.resource_id or session.resource_id
     resource = ensure_resource_access(db, user, new_resource_id)
     if payload.game_id:
-        game = db.query(Game).filter(Game.id == payload.game_id, Game.is_active.is_(True)).first()
-        if not game:
+        if not games_catalog.active(payload.game_id, db):
             raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
 
     new_start = payload.start_at or session.start_at
@@ -136,14 +205,16 @@ def update_session(db: Session, user, session_id: int, payload) -> SessionModel:
 
     if changes:
         log_action(db, user.id, "session", session.id, "update", changes)
+    apply_stats(db, stats.add(session))
 
-    db.commit()
-    db.refresh(session)
-    return session
+    with overlap_conflict(db):
+        db.commit()
+    return _after_commit(db, session_id, "update", previous)
 
 
 def cancel_session(db: Session, user, session_id: int, reason: str) -> SessionModel:
     session = ensure_session_access(db, user, session_id)
+    stats = StatsDelta().remove(session)
 
     session.status = SessionStatus.canceled
     session.canceled_reason = reason
@@ -151,30 +222,229 @@ def cancel_session(db: Session, user, session_id: int, reason: str) -> SessionMo
     session.updated_by_id = user.id
 
     log_action(db, user.id, "session", session.id, "cancel", {"reason": reason})
+    apply_stats(db, stats.add(session))
 
     db.commit()
-    db.refresh(session)
-    return session
+    return _after_commit(db, session_id, "cancel")
 
 
 def complete_session(db: Session, user, session_id: int) -> SessionModel:
     session = ensure_session_access(db, user, session_id)
+    stats = StatsDelta().remove(session)
 
     session.status = SessionStatus.completed
     session.completed_at = datetime.now()
     session.updated_by_id = user.id
 
     log_action(db, user.id, "session", session.id, "complete", {})
+    apply_stats(db, stats.add(session))
 
-    db.commit()
-    db.refresh(session)
-    return session
+    # Completing a canceled session puts it back under sessions_no_overlap,
+    # and its slot may have been rebooked since.
+    with overlap_conflict(db):
+        db.commit()
+    return _after_commit(db, session_id, "complete")
 
 
 def delete_session(db: Session, user, session_id: int, reason: str) -> None:
     session = ensure_session_access(db, user, session_id)
+    event = deleted_event(session.id, session.location_id, session.start_at.date())
 
     log_action(db, user.id, "session", session.id, "delete", {"reason": reason})
+    apply_stats(db, StatsDelta().remove(session))
 
     db.delete(session)
     db.commit()
+    if settings.OVERLAP_INDEX_ENABLED:
+        overlap_index.discard(session_id)
+    publish_session_events(db, [event])
+
+
+def _batch_overlaps(db: Session, candidates: list[tuple[int, object, datetime]]) -> dict[int, str]:
+    # candidates are (index, payload, end_at); returns index -> error for every
+    # item that overlaps the database or an earlier item of the same batch.
+    by_resource: dict[int, list[tuple[int, object, datetime]]] = defaultdict(list)
+    for candidate in candidates:
+        by_resource[candidate[1].resource_id].append(candidate)
+
+    errors: dict[int, str] = {}
+    for resource_id, items in by_resource.items():
+        items.sort(key=lambda item: (item[1].start_at, item[0]))
+        rows = db.execute(
+            select(SessionModel.start_at, SessionModel.end_at)
+            .where(
+                SessionModel.resource_id == resource_id,
+                SessionModel.status != SessionStatus.canceled,
+                SessionModel.start_at < max(item[2] for item in items),
+                SessionModel.end_at > items[0][1].start_at,
+            )
+            .order_by(SessionModel.start_at.asc())
+        ).all()
+        starts = [row[0] for row in rows]
+        ends = [row[1] for row in rows]
+
+        accepted_end: datetime | None = None
+        for index, payload, end_at in items:
+            if payload.status == SessionStatus.canceled:
+                continue
+            position = bisect_left(starts, end_at) - 1
+            if position >= 0 and ends[position] > payload.start_at:
+                errors[index] = OVERLAP_DETAIL
+            elif accepted_end is not None and accepted_end > payload.start_at:
+                errors[index] = "Time overlap with another item in the batch"
+            else:
+                accepted_end = end_at
+    return errors
+
+
+def bulk_create_sessions(
+    db: Session, user, items: list, atomic: bool = True
+) -> list[tuple[int, SessionModel | None, str | None]]:
+    resource_ids = {item.resource_id for item in items}
+    resources = {item.id: item for item in db.scalars(select(Resource).where(Resource.id.in_(resource_ids)))}
+    active_games = {game_id for game_id in {item.game_id for item in items} if games_catalog.active(game_id, db)}
+
+    errors: dict[int, str] = {}
+    candidates: list[tuple[int, object, datetime]] = []
+    for index, item in enumerate(items):
+        resource = resources.get(item.resource_id)
+        if resource is None:
+            errors[index] = "Resource not found"
+        elif user.role != UserRole.owner and resource.location_id != user.location_id:
+            errors[index] = "Location access denied"
+        elif item.game_id not in active_games:
+            errors[index] = "Game not found"
+        else:
+            candidates.append((index, item, compute_end_at(item.start_at, item.duration_min)))
+    errors.update(_batch_overlaps(db, candidates))
+
+    if errors and atomic:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail=[{"index": index, "detail": errors[index]} for index in sorted(errors)],
+        )
+
+    accepted = [(index, item, end_at) for index, item, end_at in candidates if index not in errors]
+    created: dict[int, SessionModel] = {}
+    if accepted:
+        rows = [
+            {
+                "location_id": resources[item.resource_id].location_id,
+                "resource_id": item.resource_id,
+                "game_id": item.game_id,
+                "start_at": item.start_at,
+                "end_at": end_at,
+                "duration_min": item.duration_min,
+                "status": item.status,
+                "players": item.players,
+                "contact_name": item.contact_name,
+                "contact_phone": item.contact_phone,
+                "comment": item.comment,
+                "created_by_id": user.id,
+                "updated_by_id": user.id,
+            }
+            for _, item, end_at in accepted
+        ]
+        with overlap_conflict(db):
+            session_ids = db.scalars(
+                insert(SessionModel).returning(SessionModel.id, sort_by_parameter_order=True), rows
+            ).all()
+            log_actions(
+                db, [audit_entry(user.id, "session", session_id, "create", {"bulk": True}) for session_id in session_ids]
+            )
+            stats = StatsDelta()
+            for row in rows:
+                stats.add(row)
+            apply_stats(db, stats)
+            db.commit()
+
+        loaded = {item.id: item for item in db.scalars(session_select().where(SessionModel.id.in_(session_ids)))}
+        _on_committed(db, "create", list(loaded.values()))
+        created = {index: loaded[session_id] for (index, _, _), session_id in zip(accepted, session_ids)}
+
+    return [(index, created.get(index), errors.get(index)) for index in range(len(items))]
+
+
+def _series_occurrences(db: Session, user, payload) -> tuple[Resource, list[tuple[datetime, datetime]]]:
+    resource = ensure_resource_access(db, user, payload.resource_id)
+    if not games_catalog.active(payload.game_id, db):
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Game not found")
+    return resource, expand_series(payload)
+
+
+def preview_series(db: Session, user, payload) -> tuple[list[tuple[datetime, datetime]], list[Conflict]]:
+    _, occurrences = _series_occurrences(db, user, payload)
+    return occurrences, find_conflicts(db, payload.resource_id, occurrences)
+
+
+def create_series(db: Session, user, payload) -> tuple[SessionSeries, list[SessionModel], list[Conflict]]:
+    resource, occurrences = _series_occurrences(db, user, payload)
+    conflicts = find_conflicts(db, resource.id, occurrences)
+    if conflicts and not payload.skip_conflicts:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=jsonable_encoder(conflicts))
+    blocked = {conflict.start_at for conflict in conflicts}
+    free = [(start_at, end_at) for start_at, end_at in occurrences if start_at not in blocked]
+    if not free:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail=jsonable_encoder(conflicts))
+
+    series = SessionSeries(
+        location_id=resource.location_id,
+        resource_id=resource.id,
+        game_id=payload.game_id,
+        frequency=payload.frequency,
+        interval=payload.interval,
+        weekdays=series_weekdays(payload),
+        start_date=payload.start_date,
+        until_date=payload.until_date,
+        count=payload.count,
+        start_time=payload.start_time,
+        duration_min=payload.duration_min,
+        exceptions=sorted({day.isoformat() for day in payload.exceptions}),
+        players=payload.players,
+        contact_name=payload.contact_name,
+        contact_phone=payload.contact_phone,
+        comment=payload.comment,
+        created_by_id=user.id,
+    )
+    db.add(series)
+    with overlap_conflict(db):
+        db.flush()
+        series_id = series.id
+        rows = [
+            {
+                "location_id": resource.location_id,
+                "resource_id": resource.id,
+                "game_id": payload.game_id,
+                "series_id": series_id,
+                "start_at": start_at,
+                "end_at": end_at,
+                "duration_min": payload.duration_min,
+                "status": SessionStatus.planned,
+                "players": payload.players,
+                "contact_name": payload.contact_name,
+                "contact_phone": payload.contact_phone,
+                "comment": payload.comment,
+                "created_by_id": user.id,
+                "updated_by_id": user.id,
+            }
+            for start_at, end_at in free
+        ]
+        session_ids = db.scalars(
+            insert(SessionModel).returning(SessionModel.id, sort_by_parameter_order=True), rows
+        ).all()
+        log_actions(
+            db,
+            [audit_entry(user.id, "series", series_id, "create", {"occurrences": len(rows), "skipped": len(blocked)})]
+            + [audit_entry(user.id, "session", session_id, "create", {"series_id": series_id}) for session_id in session_ids],
+        )
+        stats = StatsDelta()
+        for row in rows:
+            stats.add(row)
+        apply_stats(db, stats)
+        db.commit()
+
+    sessions = list(
+        db.scalars(session_select().where(SessionModel.id.in_(session_ids)).order_by(SessionModel.start_at.asc()))
+    )
+    _on_committed(db, "create", sessions)
+    return db.get(SessionSeries, series_id), sessions, conflicts
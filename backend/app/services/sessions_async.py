@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.session import Session as SessionModel
+from app.services import sessions
+
+# The booking rules live once, in the sync service. AsyncSession.run_sync runs
+# them on the async connection inside a greenlet, so no threadpool is involved.
+
+
+async def ensure_session_access(db: AsyncSession, user, session_id: int) -> SessionModel:
+    return await db.run_sync(sessions.ensure_session_access, user, session_id)
+
+
+async def create_session(db: AsyncSession, user, payload) -> SessionModel:
+    return await db.run_sync(sessions.create_session, user, payload)
+
+
+async def bulk_create_sessions(db: AsyncSession, user, items: list, atomic: bool = True):
+    return await db.run_sync(sessions.bulk_create_sessions, user, items, atomic)
+
+
+async def update_session(db: AsyncSession, user, session_id: int, payload) -> SessionModel:
+    return await db.run_sync(sessions.update_session, user, session_id, payload)
+
+
+async def cancel_session(db: AsyncSession, user, session_id: int, reason: str) -> SessionModel:
+    return await db.run_sync(sessions.cancel_session, user, session_id, reason)
+
+
+async def complete_session(db: AsyncSession, user, session_id: int) -> SessionModel:
+    return await db.run_sync(sessions.complete_session, user, session_id)
+
+
+async def delete_session(db: AsyncSession, user, session_id: int, reason: str) -> None:
+    await db.run_sync(sessions.delete_session, user, session_id, reason)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import date
+
+from sqlalchemy import case, delete, func, insert, literal, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
+
+from app.models.enums import SessionStatus
+from app.models.session import Session as SessionModel
+from app.models.session_daily_stats import SessionDailyStats
+
+KEY_COLUMNS = ("location_id", "resource_id", "game_id", "day")
+COUNTER_COLUMNS = ("sessions", "canceled", "completed", "booked_minutes", "players")
+
+
+def _field(row, name: str):
+    return row[name] if isinstance(row, dict) else getattr(row, name)
+
+
+# Collects what a transaction adds to and removes from the rollup; a moved or
+# re-statused session is removed with its old values and added with the new.
+class StatsDelta:
+    def __init__(self) -> None:
+        self._counters: dict[tuple[int, int, int, date], list[int]] = defaultdict(
+            lambda: [0] * len(COUNTER_COLUMNS)
+        )
+
+    def add(self, row, sign: int = 1) -> StatsDelta:
+        status = _field(row, "status")
+        canceled = status == SessionStatus.canceled
+        key = (
+            _field(row, "location_id"),
+            _field(row, "resource_id"),
+            _field(row, "game_id"),
+            _field(row, "start_at").date(),
+        )
+        values = (
+            1,
+            int(canceled),
+            int(status == SessionStatus.completed),
+            0 if canceled else _field(row, "duration_min"),
+            0 if canceled else _field(row, "players") or 0,
+        )
+        counters = self._counters[key]
+        for index, value in enumerate(values):
+            counters[index] += sign * value
+        return self
+
+    def remove(self, row) -> StatsDelta:
+        return self.add(row, -1)
+
+    def rows(self) -> list[dict]:
+        # Sorted so that concurrent upserts lock shared keys in the same order.
+        return [
+            {**dict(zip(KEY_COLUMNS, key)), **dict(zip(COUNTER_COLUMNS, counters))}
+            for key, counters in sorted(self._counters.items())
+            if any(counters)
+        ]
+
+
+def apply_stats(db: Session, delta: StatsDelta) -> None:
+    rows = delta.rows()
+    if not rows:
+        return
+    insert_for = pg_insert if db.get_bind().dialect.name == "postgresql" else sqlite_insert
+    statement = insert_for(SessionDailyStats).values(rows)
+    # Increments rather than overwrites, so concurrent transactions touching
+    # the same key serialize on the row lock and both land.
+    statement = statement.on_conflict_do_update(
+        index_elements=list(KEY_COLUMNS),
+        set_={name: getattr(SessionDailyStats, name) + statement.excluded[name] for name in COUNTER_COLUMNS},
+    )
+    db.execute(statement)
+
+
+def rebuild_stats(db: Session) -> int:
+    if db.get_bind().dialect.name == "postgresql":
+        # Keep writers out while the rollup is rebuilt, or their increments
+        # would be lost with the deleted rows.
+        db.execute(text("LOCK TABLE sessions IN SHARE MODE"))
+    canceled = SessionModel.status == SessionStatus.canceled
+    source = select(
+        SessionModel.location_id,
+        SessionModel.resource_id,
+        SessionModel.game_id,
+        func.date(SessionModel.start_at).label("day"),
+        func.count(SessionModel.id),
+        func.sum(case((canceled, 1), else_=0)),
+        func.sum(case((SessionModel.status == SessionStatus.completed, 1), else_=0)),
+        func.sum(case((canceled, 0), else_=SessionModel.duration_min)),
+        func.sum(case((canceled, 0), else_=func.coalesce(SessionModel.players, literal(0)))),
+    ).group_by(
+        SessionModel.location_id, SessionModel.resource_id, SessionModel.game_id, func.date(SessionModel.start_at)
+    )
+    db.execute(delete(SessionDailyStats))
+    result = db.execute(insert(SessionDailyStats).from_select([*KEY_COLUMNS, *COUNTER_COLUMNS], source))
+    db.commit()
+    return result.rowcount
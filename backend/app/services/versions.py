@@ -0,0 +1,37 @@
+from __future__ import annotations
+
+from datetime import datetime
+
+from sqlalchemy import Select, func, select, true
+
+from app.models.game import Game
+from app.models.resource import Resource
+from app.models.session import Session as SessionModel
+
+
+# Each statement returns one row of (count, max(updated_at)) pairs. A row
+# that is added, changed or removed moves at least one of them, which is all
+# a validator needs; the rows themselves are never read.
+def games_version() -> Select:
+    return select(func.count(Game.id), func.max(Game.updated_at))
+
+
+def resources_version(location_id: int | None) -> Select:
+    query = select(func.count(Resource.id), func.max(Resource.updated_at))
+    if location_id is not None:
+        query = query.where(Resource.location_id == location_id)
+    return query
+
+
+def calendar_version(start: datetime, end: datetime, location_id: int | None) -> Select:
+    # Calendar rows embed resource names, so the resource stamp is part of the
+    # day's version too. Game names come from games_catalog, whose own version
+    # the caller adds.
+    sessions = select(func.count(SessionModel.id), func.max(SessionModel.updated_at)).where(
+        SessionModel.start_at >= start, SessionModel.start_at < end
+    )
+    if location_id is not None:
+        sessions = sessions.where(SessionModel.location_id == location_id)
+    sessions = sessions.subquery()
+    resources = resources_version(location_id).subquery()
+    return select(*sessions.c, *resources.c).select_from(sessions.join(resources, true()))
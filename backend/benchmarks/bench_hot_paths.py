@@ -0,0 +1,90 @@
+import random
+from collections import Counter
+from datetime import datetime, timedelta
+
+from benchmarks.defaults import OPEN_AT, OWNER_EMAIL, PASSWORD
+from tests.sql import count_statements
+
+
+def bench_calendar_day(benchmark, client, owner_headers, busy_day):
+    response = benchmark(client.get, "/calendar/day", params={"date": busy_day.isoformat()}, headers=owner_headers)
+    assert response.status_code == 200
+    benchmark.extra_info["rows"] = len(response.json())
+
+
+def bench_calendar_day_not_modified(benchmark, client, owner_headers, busy_day):
+    params = {"date": busy_day.isoformat()}
+    etag = client.get("/calendar/day", params=params, headers=owner_headers).headers["etag"]
+    headers = {**owner_headers, "If-None-Match": etag}
+    response = benchmark(client.get, "/calendar/day", params=params, headers=headers)
+    assert response.status_code == 304
+
+
+def bench_calendar_day_statement_count(client, owner_headers, busy_day, empty_day):
+    # The day view must not issue per-row queries: a full day and an empty
+    # one cost the same number of statements.
+    def fetch(day):
+        return lambda: client.get("/calendar/day", params={"date": day.isoformat()}, headers=owner_headers)
+
+    assert count_statements(fetch(busy_day)) == count_statements(fetch(empty_day))
+
+
+def bench_create_session(benchmark, client, owner_headers, dataset):
+    # Random slots over the seeded range, so a realistic share of attempts
+    # collides with existing bookings and takes the 409 path.
+    rng = random.Random(19)
+    outcomes: Counter = Counter()
+
+    def create():
+        day = dataset.first_day + timedelta(days=rng.randrange(dataset.days + 30))
+        start_at = datetime.combine(day, OPEN_AT) + timedelta(minutes=30 * rng.randrange(20))
+        response = client.post(
+            "/sessions",
+            json={
+                "resource_id": rng.choice(dataset.resource_ids),
+                "game_id": rng.choice(dataset.game_ids),
+                "start_at": start_at.isoformat(),
+                "duration_min": rng.choice((30, 60, 90)),
+                "players": rng.randint(1, 8),
+            },
+            headers=owner_headers,
+        )
+        outcomes[response.status_code] += 1
+        return response
+
+    benchmark(create)
+    total = sum(outcomes.values())
+    assert set(outcomes) <= {201, 409}, outcomes
+    benchmark.extra_info["conflict_rate"] = round(outcomes[409] / total, 4)
+
+
+def bench_update_session(benchmark, client, owner_headers, dataset):
+    # Re-sending start_at forces the overlap check, like a real edit form.
+    rng = random.Random(20)
+    sample = [
+        client.get(f"/sessions/{session_id}", headers=owner_headers).json()
+        for session_id in rng.sample(dataset.session_ids, min(200, len(dataset.session_ids)))
+    ]
+
+    def update():
+        current = rng.choice(sample)
+        response = client.put(
+            f"/sessions/{current['id']}",
+            json={"start_at": current["start_at"], "comment": f"bench {rng.randrange(1000)}"},
+            headers=owner_headers,
+        )
+        assert response.status_code == 200, response.text
+        return response
+
+    benchmark(update)
+
+
+def bench_login(benchmark, client):
+    response = benchmark.pedantic(
+        client.post,
+        args=("/auth/login",),
+        kwargs={"json": {"email": OWNER_EMAIL, "password": PASSWORD}},
+        rounds=20,
+        iterations=1,
+    )
+    assert response.status_code == 200
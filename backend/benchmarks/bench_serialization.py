@@ -0,0 +1,47 @@
+import json
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.api.utils import dump_json
+from app.db.session import SessionLocal
+from app.schemas.session import SessionOut
+from app.services.games_catalog import games_catalog
+from app.services.session_out import session_fields
+from app.services.sessions import session_select
+
+ROWS = 1000
+session_list_adapter = TypeAdapter(list[SessionOut])
+
+
+@pytest.fixture(scope="module")
+def rows(dataset):
+    with SessionLocal() as db:
+        games_catalog.load(db)
+        rows = db.scalars(session_select().order_by(None).limit(ROWS)).all()
+        db.expunge_all()
+    assert len(rows) == ROWS
+    return rows
+
+
+def validated_path(rows) -> bytes:
+    # What a list endpoint cost before: validated models, then FastAPI's
+    # response_model round trip (dump, validate, dump) and stdlib json.
+    items = [SessionOut(**session_fields(row)) for row in rows]
+    content = session_list_adapter.validate_python([item.model_dump() for item in items])
+    return json.dumps(session_list_adapter.dump_python(content, mode="json"), separators=(",", ":")).encode()
+
+
+def fast_path(rows) -> bytes:
+    return dump_json([session_fields(row) for row in rows])
+
+
+def bench_serialize_validated(benchmark, rows):
+    benchmark.group = f"serialize {ROWS} sessions"
+    body = benchmark(validated_path, rows)
+    assert json.loads(body) == json.loads(fast_path(rows))
+
+
+def bench_serialize_fast(benchmark, rows):
+    benchmark.group = f"serialize {ROWS} sessions"
+    benchmark(fast_path, rows)
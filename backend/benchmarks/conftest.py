@@ -0,0 +1,73 @@
+import os
+import tempfile
+from datetime import timedelta
+from pathlib import Path
+
+import pytest
+from sqlalchemy.engine import make_url
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# The app reads its settings at import time, so the target database has to be
+# chosen before anything from app is imported.
+DATABASE_URL = os.environ.get("BENCH_DATABASE_URL") or f"sqlite:///{Path(tempfile.gettempdir()) / 'vr_admin_bench.db'}"
+os.environ["DATABASE_URL"] = DATABASE_URL
+os.environ.setdefault("JWT_SECRET", "bench-secret")
+BENCH_SESSIONS = int(os.environ.get("BENCH_SESSIONS", "20000"))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from benchmarks.dataset import seed_dataset  # noqa: E402
+from benchmarks.defaults import OWNER_EMAIL, PASSWORD  # noqa: E402
+
+
+def _prepare_schema() -> None:
+    url = make_url(DATABASE_URL)
+    if url.get_backend_name() == "sqlite":
+        Base.metadata.drop_all(engine)
+        Base.metadata.create_all(engine)
+        return
+    # The dataset is wiped before seeding; refuse anything that is not
+    # obviously a throwaway database.
+    if "bench" not in (url.database or ""):
+        raise pytest.UsageError("BENCH_DATABASE_URL must point at a database whose name contains 'bench'")
+    from alembic import command
+    from alembic.config import Config
+
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    command.upgrade(config, "head")
+
+
+@pytest.fixture(scope="session")
+def dataset():
+    _prepare_schema()
+    with SessionLocal() as db:
+        return seed_dataset(db, sessions=BENCH_SESSIONS)
+
+
+@pytest.fixture(scope="session")
+def client(dataset):
+    from app.main import app
+
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+@pytest.fixture(scope="session")
+def owner_headers(client):
+    response = client.post("/auth/login", json={"email": OWNER_EMAIL, "password": PASSWORD})
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+@pytest.fixture(scope="session")
+def busy_day(dataset):
+    return dataset.first_day + timedelta(days=dataset.days // 2)
+
+
+@pytest.fixture(scope="session")
+def empty_day(dataset):
+    return dataset.last_day + timedelta(days=30)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from datetime import date
+
+from sqlalchemy.orm import Session
+
+from app.seed.synthetic import SyntheticSummary, generate
+from benchmarks.defaults import OWNER_EMAIL, PASSWORD
+
+# The benchmarks read ids and the day range straight off the generator summary.
+Dataset = SyntheticSummary
+
+
+def seed_dataset(
+    db: Session,
+    locations: int = 3,
+    resources_per_location: int = 4,
+    games: int = 12,
+    sessions: int = 20000,
+    first_day: date = date(2026, 1, 1),
+    seed: int = 1,
+) -> Dataset:
+    return generate(
+        db,
+        locations=locations,
+        resources_per_location=resources_per_location,
+        games=games,
+        sessions=sessions,
+        first_day=first_day,
+        seed=seed,
+        owner_email=OWNER_EMAIL,
+        password=PASSWORD,
+        audit=False,
+        reset=True,
+        progress=False,
+    )
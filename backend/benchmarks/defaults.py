@@ -0,0 +1,7 @@
+from datetime import time
+
+# Kept free of app imports so the load generator can run on a machine without
+# the app's settings.
+OWNER_EMAIL = "bench-owner@example.com"
+PASSWORD = "bench-password"
+OPEN_AT = time(10, 0)
@@ -0,0 +1,181 @@
+import argparse
+import asyncio
+import random
+import time
+from collections import Counter, defaultdict
+from dataclasses import dataclass, field
+from datetime import date, datetime, timedelta
+
+import httpx
+
+from benchmarks.defaults import OPEN_AT, OWNER_EMAIL, PASSWORD
+
+DEFAULT_MIX = "calendar=70,create=15,update=10,login=5"
+
+
+@dataclass
+class Fixtures:
+    resource_ids: list[int]
+    game_ids: list[int]
+    sessions: list[dict]
+    days: list[date]
+
+
+@dataclass
+class Results:
+    latencies: dict[str, list[float]] = field(default_factory=lambda: defaultdict(list))
+    statuses: dict[str, Counter] = field(default_factory=lambda: defaultdict(Counter))
+    errors: Counter = field(default_factory=Counter)
+
+    def record(self, operation: str, started: float, status_code: int) -> None:
+        self.latencies[operation].append(time.perf_counter() - started)
+        self.statuses[operation][status_code] += 1
+
+
+def parse_mix(value: str) -> dict[str, int]:
+    mix = {}
+    for part in value.split(","):
+        name, _, weight = part.partition("=")
+        if name not in OPERATIONS or not weight.isdigit():
+            raise argparse.ArgumentTypeError(f"invalid mix entry: {part!r}")
+        mix[name] = int(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("mix weights must not all be zero")
+    return mix
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(fraction * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def login(client: httpx.AsyncClient, email: str, password: str) -> dict:
+    response = await client.post("/auth/login", json={"email": email, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+async def load_fixtures(client: httpx.AsyncClient, headers: dict) -> Fixtures:
+    resources = (await client.get("/resources", headers=headers)).raise_for_status().json()
+    games = (await client.get("/games", headers=headers)).raise_for_status().json()
+    page = (await client.get("/sessions", params={"limit": 200}, headers=headers)).raise_for_status().json()
+    sessions = page["items"]
+    if not resources or not games or not sessions:
+        raise SystemExit("the target has no resources, games or sessions; seed it first")
+    days = sorted({datetime.fromisoformat(item["start_at"]).date() for item in sessions})
+    return Fixtures(
+        resource_ids=[item["id"] for item in resources],
+        game_ids=[item["id"] for item in games],
+        sessions=sessions,
+        days=days,
+    )
+
+
+async def op_calendar(client, headers, fixtures, rng, args) -> httpx.Response:
+    day = rng.choice(fixtures.days)
+    return await client.get("/calendar/day", params={"date": day.isoformat()}, headers=headers)
+
+
+async def op_create(client, headers, fixtures, rng, args) -> httpx.Response:
+    day = rng.choice(fixtures.days) + timedelta(days=rng.randrange(7))
+    start_at = datetime.combine(day, OPEN_AT) + timedelta(minutes=30 * rng.randrange(20))
+    return await client.post(
+        "/sessions",
+        json={
+            "resource_id": rng.choice(fixtures.resource_ids),
+            "game_id": rng.choice(fixtures.game_ids),
+            "start_at": start_at.isoformat(),
+            "duration_min": rng.choice((30, 60, 90)),
+            "players": rng.randint(1, 8),
+        },
+        headers=headers,
+    )
+
+
+async def op_update(client, headers, fixtures, rng, args) -> httpx.Response:
+    current = rng.choice(fixtures.sessions)
+    return await client.put(
+        f"/sessions/{current['id']}",
+        json={"start_at": current["start_at"], "comment": f"load {rng.randrange(1000)}"},
+        headers=headers,
+    )
+
+
+async def op_login(client, headers, fixtures, rng, args) -> httpx.Response:
+    return await client.post("/auth/login", json={"email": args.email, "password": args.password})
+
+
+OPERATIONS = {"calendar": op_calendar, "create": op_create, "update": op_update, "login": op_login}
+
+
+async def worker(client, headers, fixtures, rng, args, deadline, results) -> None:
+    names = list(args.mix)
+    weights = [args.mix[name] for name in names]
+    while time.perf_counter() < deadline:
+        name = rng.choices(names, weights)[0]
+        started = time.perf_counter()
+        try:
+            response = await OPERATIONS[name](client, headers, fixtures, rng, args)
+        except httpx.HTTPError as exc:
+            results.errors[f"{name}: {type(exc).__name__}"] += 1
+            continue
+        results.record(name, started, response.status_code)
+
+
+def report(results: Results, elapsed: float) -> None:
+    print(f"{'operation':<10} {'count':>7} {'rps':>8} {'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}  statuses")
+    total = 0
+    for name, latencies in sorted(results.latencies.items()):
+        total += len(latencies)
+        statuses = ", ".join(f"{code}={count}" for code, count in sorted(results.statuses[name].items()))
+        print(
+            f"{name:<10} {len(latencies):>7} {len(latencies) / elapsed:>8.1f} "
+            f"{percentile(latencies, 0.50) * 1000:>8.1f} {percentile(latencies, 0.95) * 1000:>8.1f} "
+            f"{percentile(latencies, 0.99) * 1000:>8.1f}  {statuses}"
+        )
+    print(f"total      {total:>7} {total / elapsed:>8.1f}")
+
+    created = results.statuses.get("create")
+    if created:
+        print(f"create conflict rate: {created[409] / sum(created.values()):.2%}")
+    failed = sum(
+        count for counter in results.statuses.values() for code, count in counter.items() if code >= 500
+    )
+    if failed or results.errors:
+        print(f"server errors: {failed}")
+        for error, count in results.errors.most_common():
+            print(f"  {error}: {count}")
+
+
+async def run(args) -> None:
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    async with httpx.AsyncClient(base_url=args.base_url, limits=limits, timeout=30) as client:
+        headers = await login(client, args.email, args.password)
+        fixtures = await load_fixtures(client, headers)
+        results = Results()
+        started = time.perf_counter()
+        deadline = started + args.duration
+        await asyncio.gather(
+            *(
+                worker(client, headers, fixtures, random.Random(args.seed + index), args, deadline, results)
+                for index in range(args.concurrency)
+            )
+        )
+        report(results, time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Drive a running API with a mixed booking workload")
+    parser.add_argument("--base-url", default="http://localhost:8000")
+    parser.add_argument("--email", default=OWNER_EMAIL)
+    parser.add_argument("--password", default=PASSWORD)
+    parser.add_argument("--duration", type=float, default=30.0, help="seconds")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX))
+    parser.add_argument("--seed", type=int, default=1)
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
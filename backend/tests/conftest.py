@@ -0,0 +1,54 @@
+import os
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# The app reads its settings at import time, so the test database has to be
+# chosen before anything from app is imported.
+os.environ["DATABASE_URL"] = f"sqlite:///{Path(tempfile.gettempdir()) / 'vr_admin_test.db'}"
+os.environ.setdefault("JWT_SECRET", "test-secret")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.api.deps import get_current_user  # noqa: E402
+from app.core.principals import Principal  # noqa: E402
+from app.db.base import Base  # noqa: E402
+from app.db.session import SessionLocal, engine  # noqa: E402
+from app.models.enums import UserRole  # noqa: E402
+from app.models.game import Game  # noqa: E402
+from app.models.location import Location  # noqa: E402
+from app.models.resource import Resource  # noqa: E402
+from app.models.user import User  # noqa: E402
+
+
+@pytest.fixture
+def db():
+    Base.metadata.drop_all(engine)
+    Base.metadata.create_all(engine)
+    with SessionLocal() as session:
+        yield session
+
+
+@pytest.fixture
+def owner(db):
+    location = Location(name="Test location")
+    db.add(location)
+    db.flush()
+    user = User(email="owner@test.local", password_hash="-", role=UserRole.owner, location_id=location.id)
+    db.add_all([user, Game(name="Test game")])
+    db.add_all(Resource(location_id=location.id, name=f"Arena {index + 1}") for index in range(4))
+    db.commit()
+    return Principal.from_user(user)
+
+
+@pytest.fixture
+def client(owner):
+    from app.main import app
+
+    app.dependency_overrides[get_current_user] = lambda: owner
+    try:
+        with TestClient(app) as test_client:
+            yield test_client
+    finally:
+        app.dependency_overrides.clear()
@@ -0,0 +1,18 @@
+from sqlalchemy import event
+
+from app.db.session import engine
+
+
+def count_statements(call) -> int:
+    statements = 0
+
+    def count(*args) -> None:
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine, "before_cursor_execute", count)
+    try:
+        call()
+    finally:
+        event.remove(engine, "before_cursor_execute", count)
+    return statements
@@ -0,0 +1,45 @@
+from datetime import date, datetime, time, timedelta
+
+from app.models.game import Game
+from app.models.resource import Resource
+from app.models.session import Session as SessionModel
+from tests.sql import count_statements
+
+
+def _book(db, day: date, count: int) -> None:
+    resources = db.query(Resource).order_by(Resource.id).all()
+    game = db.query(Game).first()
+    for index in range(count):
+        # Spread over every resource, so lazy loads would show up per row.
+        resource = resources[index % len(resources)]
+        start_at = datetime.combine(day, time(10)) + timedelta(minutes=30 * (index // len(resources)))
+        db.add(
+            SessionModel(
+                location_id=resource.location_id,
+                resource_id=resource.id,
+                game_id=game.id,
+                start_at=start_at,
+                end_at=start_at + timedelta(minutes=30),
+                duration_min=30,
+            )
+        )
+    db.commit()
+
+
+def test_calendar_day_statement_count_does_not_grow_with_sessions(db, client):
+    # One session or twenty on a day: the day view must not issue per-row
+    # queries for resources or games.
+    one, many = date(2026, 3, 2), date(2026, 3, 3)
+    _book(db, one, 1)
+    _book(db, many, 20)
+
+    def fetch(day):
+        def call():
+            response = client.get("/calendar/day", params={"date": day.isoformat()})
+            assert response.status_code == 200, response.text
+            return response
+
+        return call
+
+    assert len(fetch(many)().json()) == 20
+    assert count_statements(fetch(one)) == count_statements(fetch(many))
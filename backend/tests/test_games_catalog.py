@@ -0,0 +1,19 @@
+from app.db.session import SessionLocal
+from app.models.game import Game
+from app.services.games_catalog import games_catalog
+
+
+def test_game_created_elsewhere_is_found_right_after_another_miss(db):
+    games_catalog.load(db)
+    assert games_catalog.get(999999, db) is None
+
+    with SessionLocal() as other:
+        game = Game(name="Created elsewhere")
+        other.add(game)
+        other.commit()
+        game_id = game.id
+
+    found = games_catalog.active(game_id, db)
+    assert found is not None and found.name == "Created elsewhere"
+    # The catalog itself was reloaded, so rendering without a session sees it too.
+    assert games_catalog.get(game_id) is not None
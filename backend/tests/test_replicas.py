@@ -0,0 +1,13 @@
+from app.db.replicas import ReadReplicas, parse_lsn
+
+
+def test_pick_skips_replicas_that_have_not_replayed_the_requested_lsn():
+    replicas = ReadReplicas(["sqlite://", "sqlite://"])
+    behind, ahead = replicas.replicas
+    for replica, replayed in ((behind, "0/16B3740"), (ahead, "1/0")):
+        replica.lag = 0.0
+        replica.replayed = parse_lsn(replayed)
+
+    assert {replicas.pick() for _ in range(4)} == {behind, ahead}
+    assert {replicas.pick(parse_lsn("0/16B3741")) for _ in range(4)} == {ahead}
+    assert replicas.pick(parse_lsn("1/1")) is None
@@ -1,4 +1,4 @@
-import type { Game, Resource, Session, SessionCreate, SessionUpdate, UserInfo } from "./types";
+import type { CalendarEvent, Game, Resource, Session, SessionCreate, SessionUpdate, UserInfo } from "./types";
 
 const API_BASE = import.meta.env.VITE_API_BASE ?? "/api";
 
@@ -43,8 +43,26 @@ export async function getResources(): Promise<Resource[]> {
   return request("/resources");
 }
 
-export async function getCalendarDay(date: string): Promise<Session[]> {
-  return request(`/calendar/day?date=${date}`);
+// Pass the lsn of the calendar event that prompted the refetch, so the day is
+// only read from a replica that already has that change.
+export async function getCalendarDay(date: string, minLsn?: string | null): Promise<Session[]> {
+  return request(`/calendar/day?date=${date}`, minLsn ? { headers: { "X-Min-LSN": minLsn } } : {});
+}
+
+export async function getCalendarRange(from: string, to: string): Promise<Session[]> {
+  return request(`/calendar/range?from=${from}&to=${to}&format=json`);
+}
+
+export function openCalendarStream(
+  date: string,
+  onSnapshot: (sessions: Session[]) => void,
+  onChange: (event: CalendarEvent) => void
+): EventSource {
+  const params = new URLSearchParams({ date, access_token: authToken });
+  const source = new EventSource(`${API_BASE}/calendar/stream?${params}`);
+  source.addEventListener("snapshot", (event) => onSnapshot(JSON.parse((event as MessageEvent).data)));
+  source.addEventListener("session", (event) => onChange(JSON.parse((event as MessageEvent).data)));
+  return source;
 }
 
 export async function createSession(payload: SessionCreate): Promise<Session> {
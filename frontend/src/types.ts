@@ -41,6 +41,15 @@ export interface Session {
   updated_at?: string | null;
 }
 
+export interface CalendarEvent {
+  action: "create" | "update" | "cancel" | "complete" | "delete";
+  session_id: number;
+  location_ids: number[];
+  dates: string[];
+  session: Session | null;
+  lsn: string | null;
+}
+
 export interface SessionCreate {
   resource_id: number;
   game_id: number;